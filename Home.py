@@ -11,6 +11,12 @@ st.set_page_config(
     menu_items={}  # removes hamburger menu
 )
 
+from profiling import start_rerun
+from session_store import forget_session, persist_session, restore_session
+
+profiler = start_rerun("Home")
+restore_session()
+
 # ------------------- Logo Display ------------------- #
 def get_base64_of_image(image_path):
     """Convert image to base64 to ensure it displays correctly in Streamlit."""
@@ -34,23 +40,17 @@ try:
 
 except FileNotFoundError:
     st.error("⚠ logo.png not found. Please ensure the logo file is in the same directory.")
+profiler.mark("logo")
 
 
 
-import re
-import os
-
 import numpy as np
-import google.generativeai as genai
-from dotenv import load_dotenv
 import plotly.graph_objects as go
-import json
 
-# ------------------- Setup ------------------- #
-load_dotenv()
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-if GEMINI_API_KEY:
-    genai.configure(api_key=GEMINI_API_KEY)
+from uploads import UploadRejected, read_resume, upload_report_caption
+from scheduler import quota
+from incremental_analysis import analyze_incremental
+profiler.mark("imports")
 
 st.markdown("""
     <style>
@@ -114,7 +114,7 @@ a[data-testid="stPageLink-NavLink"] > span {
 """, unsafe_allow_html=True)
 
 # Navbar layout
-col1, col2, col3, col4 = st.columns(4)
+col1, col2, col3, col4, col5 = st.columns(5)
 
 with col1:
     st.page_link("Home.py", label="Home", icon="🛖")
@@ -124,80 +124,13 @@ with col3:
     st.page_link("pages/Deep_Dive.py", label="Deep Dive", icon="🔬")
 with col4:
     st.page_link("pages/Preparation_Plan.py", label="Plan", icon="📅")
+with col5:
+    st.page_link("pages/Job_Matching.py", label="Job Match", icon="🎯")
+profiler.mark("navbar")
 
 
 
 
-# ------------------- Resume PDF Processing ------------------- #
-def extract_text(file_bytes):
-    doc = fitz.open(stream=file_bytes, filetype="pdf")
-    text = ""
-    for page in doc:
-        text += page.get_text()
-    return text.strip()
-
-# ------------------- Gemini Scoring ------------------- #
-def final_score_with_gemini(resume_text, jd_text):
-    if not GEMINI_API_KEY:
-        return {}
-
-    model = genai.GenerativeModel("gemini-2.0-flash")
-
-    prompt = f"""
-    You are an AI resume-job description evaluator. Provide a structured, ATS-style analysis.
-
-    Resume: {resume_text[:2500]}
-    Job Description: {jd_text[:2500]}
-
-    Return output strictly in JSON with the following keys:
-    {{
-    "overall_score": number (0-100),
-    "semantic_score": number (0-100),
-    "skill_score": number (0-100),
-
-    "feedback": "Comprehensive qualitative feedback. 
-                Break it into sections:
-                - Strengths (detailed and contextual, highlight relevant projects/roles).
-                - Weaknesses/Missing Skills (list clearly, explain why they matter).
-                - Opportunities (where the resume could be tailored more).
-                - Risks (any red flags like gaps, vague descriptions).
-                Provide at least 2-3 points under each section.",
-
-    "soft_skills_required": ["list of soft skills from JD"],
-    "soft_skills_present": ["soft skills inferred from resume"],
-    "technical_skills_required": ["list of technical skills required from JD"],
-    "technical_skills_present": ["technical skills present in resume"],
-
-    "recommendations": [
-        "Provide at least 5 tailored suggestions to improve the resume. 
-        Suggestions should include keyword enrichment, ATS optimization, 
-        quantifying impact (numbers/metrics), highlighting projects, 
-        and aligning achievements with JD."
-    ]
-    }};
-    """
-
-
-    try:
-        response = model.generate_content(prompt)
-        raw_text = response.text.strip()
-
-        # Try direct JSON parse
-        try:
-            result = json.loads(raw_text)
-        except:
-            # Extract JSON substring if extra text exists
-            match = re.search(r"\{.*\}", raw_text, re.S)
-            if match:
-                result = json.loads(match.group(0))
-            else:
-                raise ValueError("No valid JSON found in Gemini response")
-
-        return result
-
-    except Exception as e:
-        return {"error": str(e)}
-
 # ------------------- Plotly Gauge ------------------- #
 def circular_gauge(label, value, color):
     fig = go.Figure(go.Indicator(
@@ -239,6 +172,9 @@ if "resume_file_key" not in st.session_state:
     st.session_state.resume_file_key = 0
 if "jd_input_key" not in st.session_state:
     st.session_state.jd_input_key = 0
+# Per-section results kept across "New Analysis" so small edits are re-analyzed incrementally
+if "analysis_cache" not in st.session_state:
+    st.session_state.analysis_cache = {}
 
 # Store results (main metrics)
 if "overall_score" not in st.session_state:
@@ -268,8 +204,9 @@ colA, colB = st.columns([1, 1])
 with colB:
     if st.button("New Analysis", use_container_width=True, help="Start a fresh analysis"):
         for key in list(st.session_state.keys()):
-            if key not in ["resume_file_key", "jd_input_key"]:
+            if key not in ["resume_file_key", "jd_input_key", "analysis_cache"]:
                 st.session_state[key] = None
+        forget_session()
         st.session_state.analysis_done = False
         st.session_state.resume_file_key += 1
         st.session_state.jd_input_key += 1
@@ -296,17 +233,26 @@ jd_input = st.text_area(
 with colA:
     start_btn = st.button(" Start Analysis", use_container_width=True, disabled=st.session_state.analysis_done, help="Click to analyze your resume")
 
+profiler.mark("inputs")
+
 # ------------------- Submit Analysis ------------------- #
 if start_btn:
     if resume_file and jd_input.strip():
         with st.spinner("Analyzing resume with Gemini AI..."):
-            st.session_state.resume_text = extract_text(resume_file.read())
+            try:
+                st.session_state.resume_text, st.session_state.upload_report = read_resume(resume_file)
+            except UploadRejected as e:
+                st.error(f"⚠ {e}")
+                st.stop()
+            profiler.mark("pdf_extraction")
             st.session_state.jd_text = jd_input.strip()
 
-            result = final_score_with_gemini(
+            result = analyze_incremental(
                 st.session_state.resume_text,
-                st.session_state.jd_text
+                st.session_state.jd_text,
+                st.session_state.analysis_cache
             )
+            profiler.mark("llm_analysis")
 
             # Store only the needed ones for Home page
             st.session_state.overall_score = result.get("overall_score", 0)
@@ -322,6 +268,7 @@ if start_btn:
             st.session_state.recommendations = result.get("recommendations", [])
 
             st.session_state.analysis_done = True
+            persist_session()
 
         st.rerun()
     else:
@@ -338,6 +285,35 @@ if st.session_state.analysis_done and st.session_state.overall_score is not None
         circular_gauge("Semantic Similarity", round(st.session_state.semantic_score, 2), get_color(st.session_state.semantic_score))
     with col3:
         circular_gauge("Skill Match", round(st.session_state.skill_score, 2), get_color(st.session_state.skill_score))
+    profiler.mark("gauges")
 
     st.subheader("📝 Qualitative Feedback")
     st.write(st.session_state.feedback_text)
+
+    if st.session_state.get("upload_report"):
+        st.caption(upload_report_caption(st.session_state.upload_report))
+
+    stats = st.session_state.analysis_cache.get("last_stats")
+    if stats and stats.get("reused"):
+        st.caption("♻️ Resume and job description unchanged; reused the previous analysis.")
+    elif stats:
+        st.caption(
+            f"♻️ Recomputed {stats['jd_blocks_recomputed']}/{stats['jd_blocks']} JD blocks and "
+            f"{stats['resume_sections_recomputed']}/{stats['resume_sections']} resume sections; the rest was reused from earlier analyses."
+        )
+
+# ------------------- Gemini Quota ------------------- #
+# Capacity-planning data for operators: shown with the profiler (PROFILE_PAGES=1 or ?profile=1)
+if profiler.enabled:
+    with st.expander("⏱ Gemini Quota Usage"):
+        quota_stats = quota.stats()
+        st.caption(f"Tokens available now: {quota_stats['tokens_available']}")
+        st.dataframe(
+            [
+                {"Priority": name.title(), "Queued": quota_stats["queue_depth"][name], **wait}
+                for name, wait in quota_stats["wait"].items()
+            ],
+            use_container_width=True,
+        )
+
+profiler.render()
@@ -0,0 +1,91 @@
+import re
+import os
+import json
+
+import google.generativeai as genai
+from dotenv import load_dotenv
+
+import stub_model
+from scheduler import Priority, quota
+
+# ------------------- Setup ------------------- #
+load_dotenv()
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+if GEMINI_API_KEY:
+    genai.configure(api_key=GEMINI_API_KEY)
+
+# "stub" answers locally with canned replies (load tests, offline runs)
+GEMINI_BACKEND = os.getenv("GEMINI_BACKEND", "gemini")
+GEMINI_ENABLED = bool(GEMINI_API_KEY) or GEMINI_BACKEND == "stub"
+
+# ------------------- Gemini Calls ------------------- #
+def gemini_generate(prompt, priority=Priority.ANALYSIS, model_name="gemini-2.0-flash"):
+    """Every model call goes through here so it waits its turn on the shared quota."""
+    quota.acquire(priority)
+    if GEMINI_BACKEND == "stub":
+        return stub_model.generate(prompt)
+    model = genai.GenerativeModel(model_name)
+    return model.generate_content(prompt).text
+
+# ------------------- Gemini Scoring ------------------- #
+def parse_json_response(raw_text):
+    """Parse a JSON object out of a model reply, tolerating surrounding prose."""
+    try:
+        return json.loads(raw_text)
+    except:
+        # Extract JSON substring if extra text exists
+        match = re.search(r"\{.*\}", raw_text, re.S)
+        if match:
+            return json.loads(match.group(0))
+        raise ValueError("No valid JSON found in Gemini response")
+
+
+def final_score_with_gemini(resume_text, jd_text):
+    if not GEMINI_ENABLED:
+        return {}
+
+    prompt = f"""
+    You are an AI resume-job description evaluator. Provide a structured, ATS-style analysis.
+
+    Resume: {resume_text[:2500]}
+    Job Description: {jd_text[:2500]}
+
+    Return output strictly in JSON with the following keys:
+    {{
+    "overall_score": number (0-100),
+    "semantic_score": number (0-100),
+    "skill_score": number (0-100),
+
+    "feedback": "Comprehensive qualitative feedback.
+                Break it into sections:
+                - Strengths (detailed and contextual, highlight relevant projects/roles).
+                - Weaknesses/Missing Skills (list clearly, explain why they matter).
+                - Opportunities (where the resume could be tailored more).
+                - Risks (any red flags like gaps, vague descriptions).
+                Provide at least 2-3 points under each section.",
+
+    "soft_skills_required": ["list of soft skills from JD"],
+    "soft_skills_present": ["soft skills inferred from resume"],
+    "technical_skills_required": ["list of technical skills required from JD"],
+    "technical_skills_present": ["technical skills present in resume"],
+
+    "recommendations": [
+        "Provide at least 5 tailored suggestions to improve the resume.
+        Suggestions should include keyword enrichment, ATS optimization,
+        quantifying impact (numbers/metrics), highlighting projects,
+        and aligning achievements with JD."
+    ]
+    }};
+    """
+
+
+    try:
+        return parse_json_response(gemini_generate(prompt).strip())
+
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def gemini_json(prompt, priority=Priority.ANALYSIS, model_name="gemini-2.0-flash"):
+    """Run a prompt that asks for JSON and return the parsed object. Raises on failure."""
+    return parse_json_response(gemini_generate(prompt, priority, model_name).strip())
@@ -0,0 +1,184 @@
+import re
+import time
+import hashlib
+import threading
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+
+# ------------------- Configuration ------------------- #
+SIMILARITY_THRESHOLD = 0.85   # cosine similarity needed to reuse a cached answer (on top of equal content terms)
+MAX_ANSWERS_PER_RESUME = 64
+MAX_RESUMES = 200
+QUESTION_DIM = 1024
+
+COMMON_QUESTIONS = [
+    "Summarize this resume",
+    "What are my strengths?",
+    "What are my weaknesses?",
+    "What skills are listed in this resume?",
+    "Which roles is this resume best suited for?",
+]
+
+# Words that carry no meaning for matching ("what are my strengths" == "strengths")
+FILLER_WORDS = {
+    "a", "about", "am", "an", "and", "any", "are", "be", "can", "could", "do", "does",
+    "describe", "explain", "for", "give", "have", "i", "in", "included", "is", "list",
+    "listed", "me", "mentioned", "my", "of", "on", "please", "resume", "show", "tell",
+    "the", "this", "to", "what", "which", "would", "you", "your",
+}
+# Questions that lean on earlier turns can't be answered from a per-resume cache
+CONTEXT_WORDS = {"above", "again", "elaborate", "it", "more", "previous", "that", "these", "those", "they"}
+SUFFIXES = ["ization", "arize", "izing", "ize", "ary", "ies", "ing", "es", "s"]
+
+# ------------------- Question Vectors ------------------- #
+def stem(word):
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 4:
+            return word[:-len(suffix)]
+    return word
+
+def question_terms(question):
+    words = re.findall(r"[a-z0-9+#]+", question.lower())
+    return [w for w in words if w not in FILLER_WORDS]
+
+def is_cacheable(question):
+    terms = question_terms(question)
+    return bool(terms) and not CONTEXT_WORDS.intersection(terms)
+
+def content_terms(question):
+    """
+    Stemmed non-filler words. Two questions only share an answer when these are equal:
+    long questions that differ in one skill or entity ("... using Python?" / "... using
+    Java?") still have a high cosine, so similarity alone can't decide.
+    """
+    return frozenset(stem(w) for w in question_terms(question))
+
+def question_vector(question):
+    """Unit vector over hashed stemmed unigrams and bigrams of the question."""
+    stems = [stem(w) for w in question_terms(question)]
+    features = stems + [f"{a} {b}" for a, b in zip(stems, stems[1:])]
+    vector = np.zeros(QUESTION_DIM, np.float32)
+    for feature in features:
+        vector[zlib.crc32(feature.encode()) % QUESTION_DIM] += 1
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+# ------------------- Per-Resume Cache ------------------- #
+class AnswerCache:
+    """Semantic question -> answer cache for one resume, with LRU eviction."""
+
+    def __init__(self, threshold=SIMILARITY_THRESHOLD, max_entries=MAX_ANSWERS_PER_RESUME):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.vectors = np.zeros((0, QUESTION_DIM), np.float32)
+        self.term_sets = []
+        self.questions = []
+        self.answers = []
+        self.last_used = []
+        self.precompute_started = False
+
+    def _match(self, terms, vector):
+        """Index of the most similar cached question with the same content terms, or None."""
+        if not self.questions:
+            return None
+        similarities = self.vectors @ vector
+        for index in np.argsort(-similarities):
+            if similarities[index] < self.threshold:
+                return None
+            if self.term_sets[index] == terms:
+                return int(index)
+        return None
+
+    def lookup(self, question):
+        if not is_cacheable(question):
+            return None
+        terms, query = content_terms(question), question_vector(question)
+        with self.lock:
+            best = self._match(terms, query)
+            if best is None:
+                return None
+            self.last_used[best] = time.monotonic()
+            return self.answers[best]
+
+    def store(self, question, answer):
+        if not is_cacheable(question):
+            return
+        terms, vector = content_terms(question), question_vector(question)
+        with self.lock:
+            if self._match(terms, vector) is not None:
+                return
+            if len(self.questions) >= self.max_entries:
+                oldest = int(np.argmin(self.last_used))
+                self.vectors = np.delete(self.vectors, oldest, axis=0)
+                for column in (self.term_sets, self.questions, self.answers, self.last_used):
+                    del column[oldest]
+            self.vectors = np.vstack([self.vectors, vector[None, :]])
+            self.term_sets.append(terms)
+            self.questions.append(question)
+            self.answers.append(answer)
+            self.last_used.append(time.monotonic())
+
+    def precompute(self, answer_fn, questions=COMMON_QUESTIONS):
+        """Answer the common questions on a daemon thread so they are cached before the user asks."""
+        with self.lock:
+            if self.precompute_started:
+                return
+            self.precompute_started = True
+
+        def run():
+            for question in questions:
+                if self.lookup(question) is None:
+                    try:
+                        self.store(question, answer_fn(question))
+                    except Exception:
+                        pass  # the user's own question will simply miss the cache
+
+        threading.Thread(target=run, daemon=True).start()
+
+# ------------------- Process-Wide Registry ------------------- #
+_caches = OrderedDict()
+_caches_lock = threading.Lock()
+
+def resume_key(resume_text):
+    return hashlib.sha1(resume_text.encode()).hexdigest()
+
+def cache_for_resume(resume_text):
+    """Shared across sessions: users re-uploading the same resume reuse its answers."""
+    key = resume_key(resume_text)
+    with _caches_lock:
+        if key in _caches:
+            _caches.move_to_end(key)
+        else:
+            _caches[key] = AnswerCache()
+            if len(_caches) > MAX_RESUMES:
+                _caches.popitem(last=False)
+        return _caches[key]
+
+# ------------------- Self-Check ------------------- #
+# python answer_cache.py -- questions that differ only in a skill or entity must never share an answer
+DISTINCT_QUESTIONS = [
+    ("Do I have enough hands-on experience leading large distributed backend engineering teams using Python?",
+     "Do I have enough hands-on experience leading large distributed backend engineering teams using Java?"),
+    ("How many years of SQL experience do I have?", "How many years of NoSQL experience do I have?"),
+    ("Did I work at Google?", "Did I work at Amazon?"),
+    ("Am I a good fit for a data scientist role?", "Am I a good fit for a data engineer role?"),
+]
+PARAPHRASES = [
+    ("What are my strengths?", "strengths"),
+    ("Summarize this resume", "Give me a summary of my resume"),
+    ("What skills are listed in this resume?", "Which skills are mentioned?"),
+]
+
+if __name__ == "__main__":
+    for first, second in DISTINCT_QUESTIONS:
+        cache = AnswerCache()
+        cache.store(first, "first answer")
+        assert cache.lookup(second) is None, f"{second!r} reused the answer to {first!r}"
+    for first, second in PARAPHRASES:
+        cache = AnswerCache()
+        cache.store(first, "first answer")
+        assert cache.lookup(second) == "first answer", f"{second!r} missed the answer to {first!r}"
+    print(f"ok: {len(DISTINCT_QUESTIONS)} distinct pairs kept apart, {len(PARAPHRASES)} paraphrases reused")
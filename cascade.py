@@ -0,0 +1,120 @@
+import os
+import time
+import threading
+from collections import deque
+
+import numpy as np
+
+from analyzer import final_score_with_gemini, gemini_json
+from jd_library import hashed_term_vector
+
+# ------------------- Configuration ------------------- #
+LITE_MODEL = os.getenv("CASCADE_LITE_MODEL", "gemini-2.0-flash-lite")
+DEFAULT_THRESHOLDS = {
+    # Tier 1: local TF-IDF cosine similarity (0-1), the shortlist's "Similarity" / 100.
+    # PLACEHOLDERS, not calibrated values: picked on an 8-JD test library (unrelated roles
+    # <= 0.11, adjacent 0.14-0.24, same role 0.41-0.61). The IDF weights, and with them
+    # every cosine, shift as the library grows, so re-tune these per library through
+    # CASCADE_LOCAL_REJECT / CASCADE_LOCAL_ACCEPT.
+    "local_reject": float(os.getenv("CASCADE_LOCAL_REJECT", "0.12")),
+    "local_accept": float(os.getenv("CASCADE_LOCAL_ACCEPT", "0.5")),
+    # Tier 2: lite model overall score (0-100)
+    "lite_reject": float(os.getenv("CASCADE_LITE_REJECT", "35")),
+    "lite_accept": float(os.getenv("CASCADE_LITE_ACCEPT", "80")),
+}
+TIERS = ["local", "lite", "full"]
+LATENCY_SAMPLES = 500
+
+# ------------------- Tier Statistics ------------------- #
+class CascadeStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = {tier: deque(maxlen=LATENCY_SAMPLES) for tier in TIERS}
+        self.counts = {tier: 0 for tier in TIERS}
+
+    def record(self, tier, seconds):
+        with self.lock:
+            self.counts[tier] += 1
+            self.latencies[tier].append(seconds)
+
+    def summary(self):
+        """Share of traffic resolved at each tier and its end-to-end latency (includes lower tiers)."""
+        with self.lock:
+            total = sum(self.counts.values())
+            rows = []
+            for tier in TIERS:
+                samples = sorted(self.latencies[tier])
+                rows.append({
+                    "tier": tier,
+                    "requests": self.counts[tier],
+                    "share_pct": round(100 * self.counts[tier] / total, 1) if total else 0,
+                    "p50_ms": round(1000 * samples[len(samples) // 2], 1) if samples else 0,
+                    "mean_ms": round(1000 * sum(samples) / len(samples), 1) if samples else 0,
+                })
+        return rows
+
+
+stats = CascadeStats()
+
+# ------------------- Tiers ------------------- #
+def local_similarity(resume_text, jd_text, idf):
+    """Same TF-IDF cosine as JDLibrary.top_k; idf comes from JDLibrary.idf()."""
+    resume_vec = hashed_term_vector(resume_text) * idf
+    jd_vec = hashed_term_vector(jd_text) * idf
+    denom = np.linalg.norm(resume_vec) * np.linalg.norm(jd_vec)
+    return float(resume_vec @ jd_vec / denom) if denom else 0.0
+
+def lite_score(resume_text, jd_text):
+    prompt = f"""
+    Rate how well this resume fits the job description.
+
+    Resume: {resume_text[:1200]}
+    Job Description: {jd_text[:1200]}
+
+    Return output strictly in JSON:
+    {{"overall_score": number (0-100), "reason": "one sentence"}}
+    """
+    return gemini_json(prompt, model_name=LITE_MODEL)
+
+def evaluate(resume_text, jd_text, idf=None, thresholds=None):
+    """
+    Score a resume/JD pair with the cheapest tier that is confident enough:
+    local similarity for clear rejects/accepts, the lite model for the middle band,
+    and the full final_score_with_gemini analysis only when the lite score is borderline.
+    Without library IDF weights the local tier is skipped, as raw term overlap is dominated
+    by words every resume and JD share.
+    The result has the final_score_with_gemini shape plus "tier". Lower tiers return fewer
+    keys and a "verdict" ("accept" / "reject"); the local tier reports "local_similarity"
+    (0-1) instead of an overall_score, as it is not on the models' 0-100 scale.
+    """
+    limits = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+    start = time.monotonic()
+
+    similarity = local_similarity(resume_text, jd_text, idf) if idf is not None else None
+    if similarity is not None and (similarity < limits["local_reject"] or similarity >= limits["local_accept"]):
+        verdict = "reject" if similarity < limits["local_reject"] else "accept"
+        reason = "clear mismatch" if verdict == "reject" else "strong keyword overlap"
+        result = {
+            "local_similarity": round(similarity, 3),
+            "verdict": verdict,
+            "feedback": f"Screened locally ({reason}, similarity {similarity:.2f}).",
+            "tier": "local",
+        }
+        stats.record("local", time.monotonic() - start)
+        return result
+
+    try:
+        lite = lite_score(resume_text, jd_text)
+        # A reply without a numeric score raises here and escalates like a failed call
+        lite_overall = float(lite["overall_score"])
+        if lite_overall < limits["lite_reject"] or lite_overall >= limits["lite_accept"]:
+            verdict = "reject" if lite_overall < limits["lite_reject"] else "accept"
+            result = {"overall_score": lite_overall, "verdict": verdict, "feedback": lite.get("reason", ""), "tier": "lite"}
+            stats.record("lite", time.monotonic() - start)
+            return result
+    except Exception:
+        pass  # a failed or unusable lite call just escalates to the full model
+
+    result = dict(final_score_with_gemini(resume_text, jd_text), tier="full")
+    stats.record("full", time.monotonic() - start)
+    return result
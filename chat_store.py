@@ -0,0 +1,64 @@
+import time
+from collections import deque
+
+# ------------------- Configuration ------------------- #
+RECENT_WINDOW = 12          # messages always rendered
+HISTORY_PAGE_SIZE = 20      # older messages shown per page when expanded
+PROMPT_HISTORY_CHARS = 8000 # tail of the conversation sent with each question
+CHARS_PER_TOKEN = 4         # rough estimate; Gemini does not expose a local tokenizer
+
+PROMPT_PREFIX = {"user": "Q", "assistant": "A"}
+
+# ------------------- Transcript ------------------- #
+def estimate_tokens(text):
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+class ChatTranscript:
+    """
+    Chat messages with role, timestamp and token estimate. The "Q: / A:" prompt text is
+    one string capped at PROMPT_HISTORY_CHARS: each message is appended to it and whole
+    old lines are cut from the front, so its cost doesn't grow with the chat.
+    """
+
+    def __init__(self):
+        self.messages = []
+        self.total_tokens = 0
+        self._prompt_line_lengths = deque()
+        self._prompt_text = ""
+
+    def __len__(self):
+        return len(self.messages)
+
+    def add(self, role, content):
+        message = {"role": role, "content": content, "ts": time.time(), "tokens": estimate_tokens(content)}
+        self.messages.append(message)
+        self.total_tokens += message["tokens"]
+
+        line = f"{PROMPT_PREFIX[role]}: {content}\n"
+        self._prompt_text += line
+        self._prompt_line_lengths.append(len(line))
+        # Drop whole lines from the front once the text exceeds the budget
+        trim = 0
+        while len(self._prompt_text) - trim > PROMPT_HISTORY_CHARS and len(self._prompt_line_lengths) > 1:
+            trim += self._prompt_line_lengths.popleft()
+        if trim:
+            self._prompt_text = self._prompt_text[trim:]
+        return message
+
+    def prompt_history(self):
+        return self._prompt_text
+
+    def recent(self, window=RECENT_WINDOW):
+        return self.messages[-window:]
+
+    def older_count(self, window=RECENT_WINDOW):
+        return max(len(self.messages) - window, 0)
+
+    def older_page(self, page, window=RECENT_WINDOW, page_size=HISTORY_PAGE_SIZE):
+        """Page 0 is the oldest page of messages that fall outside the recent window."""
+        end = self.older_count(window)
+        start = page * page_size
+        return self.messages[start:min(start + page_size, end)]
+
+    def page_count(self, window=RECENT_WINDOW, page_size=HISTORY_PAGE_SIZE):
+        return -(-self.older_count(window) // page_size)
@@ -0,0 +1,234 @@
+import re
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+from analyzer import GEMINI_ENABLED, gemini_json
+
+# ------------------- Configuration ------------------- #
+MAX_CACHE_ENTRIES = 256   # per cache bucket, oldest entries dropped first
+JD_BLOCK_MAX_LINES = 8    # JDs without blank lines are grouped into blocks of this many lines
+FIT_TEXT_CHARS = 2500     # resume / JD text sent with the fit-score call, as in final_score_with_gemini
+
+RESUME_HEADINGS = {
+    "summary", "profile", "objective", "about me", "experience", "work experience",
+    "professional experience", "employment", "internships", "education", "skills",
+    "technical skills", "projects", "certifications", "achievements", "awards",
+    "publications", "activities", "extracurricular activities", "languages", "interests",
+}
+FEEDBACK_SECTIONS = ["strengths", "weaknesses", "opportunities", "risks"]
+SKILL_TOKEN_PATTERN = re.compile(r"\.?[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")   # keeps c++, c#, .net, node.js
+
+# ------------------- Splitting & Hashing ------------------- #
+def normalize(text):
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+def block_hash(text):
+    return hashlib.sha1(normalize(text).encode()).hexdigest()[:16]
+
+def split_jd_blocks(jd_text):
+    """Split a JD into requirement blocks: paragraphs, or fixed-size line groups when there are none."""
+    paragraphs = [p for p in re.split(r"\n\s*\n", jd_text) if p.strip()]
+    if len(paragraphs) > 1:
+        return paragraphs
+    lines = [l for l in jd_text.splitlines() if l.strip()]
+    return ["\n".join(lines[i:i + JD_BLOCK_MAX_LINES]) for i in range(0, len(lines), JD_BLOCK_MAX_LINES)]
+
+def is_heading(line):
+    stripped = line.strip().rstrip(":")
+    if not stripped or len(stripped) > 40:
+        return False
+    return stripped.lower() in RESUME_HEADINGS or (stripped.isupper() and len(stripped.split()) <= 4)
+
+def split_resume_sections(resume_text):
+    """Split extracted resume text into sections at recognised headings."""
+    sections, current = [], []
+    for line in resume_text.splitlines():
+        if is_heading(line) and current:
+            sections.append("\n".join(current))
+            current = []
+        current.append(line)
+    if current:
+        sections.append("\n".join(current))
+    return [s for s in sections if s.strip()]
+
+# ------------------- Cache Helpers ------------------- #
+def cache_bucket(cache, name):
+    return cache.setdefault(name, {})
+
+def cache_put(bucket, key, value):
+    bucket.pop(key, None)
+    bucket[key] = value
+    while len(bucket) > MAX_CACHE_ENTRIES:
+        bucket.pop(next(iter(bucket)))
+
+def unique(items):
+    seen, out = set(), []
+    for item in items:
+        if item and item.lower() not in seen:
+            seen.add(item.lower())
+            out.append(item)
+    return out
+
+def skill_tokens(name):
+    return SKILL_TOKEN_PATTERN.findall(name.lower())
+
+def contains_run(tokens, run):
+    return any(tokens[i:i + len(run)] == run for i in range(len(tokens) - len(run) + 1))
+
+def matches(required, present_list):
+    """
+    Whole-token skill match: the normalized names are equal, or one name's tokens appear
+    as a run in the other ("Python" in "Python 3"). Names of 2 characters or fewer
+    (C, R, Go) only match exactly, so they are never found inside other skill names.
+    """
+    wanted = skill_tokens(required)
+    for present in present_list:
+        have = skill_tokens(present)
+        if not wanted or not have:
+            continue
+        if wanted == have:
+            return True
+        shorter, longer = sorted((wanted, have), key=len)
+        if len("".join(shorter)) > 2 and contains_run(longer, shorter):
+            return True
+    return False
+
+def numbered(blocks):
+    return "\n\n".join(f'[{key}]\n{text}' for key, text in blocks.items())
+
+# ------------------- Gemini Calls ------------------- #
+def extract_jd_skills(blocks):
+    prompt = f"""
+    For each numbered job-description block below, list the skills it requires.
+
+    {numbered(blocks)}
+
+    Return output strictly in JSON, one entry per block id:
+    {{"<block id>": {{"soft_skills_required": [...], "technical_skills_required": [...]}}}}
+    """
+    return gemini_json(prompt)
+
+def review_resume_sections(sections):
+    prompt = f"""
+    You are an ATS-style resume reviewer. For each numbered resume section below, list the
+    skills it demonstrates and review how well the section itself is written: clarity,
+    evidence, quantified impact, gaps. Do not assume any particular job.
+
+    {numbered(sections)}
+
+    Return output strictly in JSON, one entry per section id, 0-3 short points per list:
+    {{"<section id>": {{"soft_skills_present": [...], "technical_skills_present": [...],
+      "strengths": [...], "weaknesses": [...], "opportunities": [...], "risks": [...]}}}}
+    """
+    return gemini_json(prompt)
+
+def score_fit(resume_text, jd_text):
+    prompt = f"""
+    You are an AI resume-job description evaluator. For the resume and job below,
+    score the overall fit and suggest improvements. The semantic score is how closely
+    the resume's content matches the job description.
+
+    Resume: {resume_text[:FIT_TEXT_CHARS]}
+    Job Description: {jd_text[:FIT_TEXT_CHARS]}
+
+    Return output strictly in JSON with the following keys:
+    {{
+    "overall_score": number (0-100),
+    "semantic_score": number (0-100),
+    "recommendations": ["5 one-sentence suggestions tailored to this job"]
+    }}
+    """
+    return gemini_json(prompt)
+
+def fill_missing(bucket, blocks, compute):
+    """
+    Look up every block in the cache bucket, compute only the misses in one batched call.
+    Only ids the model answered with an object are cached; if any are left out the call
+    raises, and the next run retries just those.
+    """
+    missing = {h: text for h, text in blocks.items() if h not in bucket}
+    if missing:
+        fresh = compute(missing)
+        for h in missing:
+            if isinstance(fresh.get(h), dict):
+                cache_put(bucket, h, fresh[h])
+        dropped = [h for h in missing if h not in bucket]
+        if dropped:
+            raise ValueError(f"Gemini returned no result for {len(dropped)} of {len(missing)} blocks")
+    return [bucket[h] for h in blocks], len(missing)
+
+# ------------------- Incremental Analysis ------------------- #
+def analyze_incremental(resume_text, jd_text, cache):
+    """
+    Same result shape as final_score_with_gemini, built from results cached in `cache`
+    (a plain dict, e.g. kept in st.session_state):
+
+    - unchanged resume and JD: the previous result, no Gemini calls
+    - JD blocks: required skills, keyed on the block text
+    - resume sections: skills and a job-independent review, keyed on the section text
+    - overall / semantic score and recommendations: one short call on both texts
+
+    The three calls run in parallel and only changed blocks / sections are sent, so any
+    analysis is a single round trip. Missing skills are worked out locally.
+    """
+    if not GEMINI_ENABLED:
+        return {}
+
+    results = cache_bucket(cache, "results")
+    result_key = block_hash(f"{resume_text}\0{jd_text}")
+    if result_key in results:
+        cache["last_stats"] = {"reused": True}
+        return results[result_key]
+
+    jd_blocks = {block_hash(b): b for b in split_jd_blocks(jd_text)}
+    resume_sections = {block_hash(s): s for s in split_resume_sections(resume_text)}
+
+    try:
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            jd_future = pool.submit(fill_missing, cache_bucket(cache, "jd_skills"), jd_blocks, extract_jd_skills)
+            resume_future = pool.submit(fill_missing, cache_bucket(cache, "resume_sections"), resume_sections, review_resume_sections)
+            fit_future = pool.submit(score_fit, resume_text, jd_text)
+            jd_results, jd_recomputed = jd_future.result()
+            resume_results, resume_recomputed = resume_future.result()
+            fit = fit_future.result()
+    except Exception as e:
+        return {"error": str(e)}
+
+    soft_required = unique(s for r in jd_results for s in r.get("soft_skills_required", []))
+    tech_required = unique(s for r in jd_results for s in r.get("technical_skills_required", []))
+    soft_present = unique(s for r in resume_results for s in r.get("soft_skills_present", []))
+    tech_present = unique(s for r in resume_results for s in r.get("technical_skills_present", []))
+
+    required = soft_required + tech_required
+    missing_skills = [r for r in required if not matches(r, soft_present + tech_present)]
+    skill_score = round(100 * (len(required) - len(missing_skills)) / len(required), 2) if required else 0
+
+    feedback = {name: unique(p for r in resume_results for p in r.get(name, [])) for name in FEEDBACK_SECTIONS}
+    if missing_skills:
+        feedback["weaknesses"].insert(0, "Missing skills the job asks for: " + ", ".join(missing_skills))
+    feedback_text = "\n\n".join(
+        f"**{name.title()}**\n" + "\n".join(f"- {p}" for p in points)
+        for name, points in feedback.items() if points
+    )
+
+    cache["last_stats"] = {
+        "reused": False,
+        "jd_blocks": len(jd_blocks),
+        "jd_blocks_recomputed": jd_recomputed,
+        "resume_sections": len(resume_sections),
+        "resume_sections_recomputed": resume_recomputed,
+    }
+
+    result = {
+        "overall_score": fit.get("overall_score", 0),
+        "semantic_score": fit.get("semantic_score", 0),
+        "skill_score": skill_score,
+        "feedback": feedback_text or "No feedback provided",
+        "soft_skills_required": soft_required,
+        "soft_skills_present": soft_present,
+        "technical_skills_required": tech_required,
+        "technical_skills_present": tech_present,
+        "recommendations": fit.get("recommendations", []),
+    }
+    cache_put(results, result_key, result)
+    return result
@@ -0,0 +1,188 @@
+import os
+import re
+import json
+import hashlib
+import threading
+import zlib
+
+import numpy as np
+
+# ------------------- Configuration ------------------- #
+LIBRARY_DIR = os.getenv("JD_LIBRARY_DIR", "jd_library")
+VECTOR_DIM = 4096        # hashed feature buckets per JD vector
+SCAN_CHUNK_ROWS = 2048   # rows of the memory-mapped matrix scored at a time
+
+STOP_WORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is",
+    "it", "of", "on", "or", "our", "that", "the", "this", "to", "we", "will",
+    "with", "you", "your",
+}
+TOKEN_PATTERN = re.compile(r"[a-z][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+# ------------------- Vectorizer ------------------- #
+def tokenize(text):
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOP_WORDS]
+
+def hashed_term_vector(text, dim=VECTOR_DIM):
+    """Sublinear term-frequency vector using the hashing trick, so no vocabulary has to be stored."""
+    buckets = [zlib.crc32(token.encode()) % dim for token in tokenize(text)]
+    counts = np.bincount(buckets, minlength=dim).astype(np.float32) if buckets else np.zeros(dim, np.float32)
+    return np.log1p(counts)
+
+# ------------------- JD Library ------------------- #
+class JDLibrary:
+    """
+    On-disk JD store. Vectors live in a raw float32 file that is opened as a
+    memory-mapped (count x VECTOR_DIM) matrix; JD texts live in a JSONL file and
+    are read lazily by byte offset. IDF weights are applied at query time from a
+    document-frequency vector, so adding JDs is a pure append.
+    """
+
+    def __init__(self, path=LIBRARY_DIR, dim=VECTOR_DIM):
+        self.path = path
+        self.dim = dim
+        self.lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+
+        self.vectors_path = os.path.join(path, "vectors.f32")
+        self.records_path = os.path.join(path, "jds.jsonl")
+        self.df_path = os.path.join(path, "df.npy")
+
+        self.ids = []
+        self.titles = []
+        self.offsets = []
+        self._matrix = None
+
+        if os.path.exists(self.records_path):
+            with open(self.records_path, "rb") as f:
+                offset = 0
+                for line in f:
+                    record = json.loads(line)
+                    self.ids.append(record["id"])
+                    self.titles.append(record["title"])
+                    self.offsets.append(offset)
+                    offset += len(line)
+        self.id_set = set(self.ids)
+
+        self.df = np.load(self.df_path) if os.path.exists(self.df_path) else np.zeros(dim, np.float64)
+
+        # A crash between the two appends can leave the vector file ahead of the records.
+        expected_bytes = len(self.ids) * dim * 4
+        if os.path.exists(self.vectors_path) and os.path.getsize(self.vectors_path) != expected_bytes:
+            with open(self.vectors_path, "r+b") as f:
+                f.truncate(expected_bytes)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def matrix(self):
+        if not self.ids:
+            return np.zeros((0, self.dim), np.float32)
+        if self._matrix is None:
+            self._matrix = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(len(self.ids), self.dim))
+        return self._matrix
+
+    def add(self, title, text):
+        return self.add_many([(title, text)])
+
+    def add_many(self, items):
+        """Append (title, text) pairs to the index. Duplicate JD texts are skipped. Returns the new ids."""
+        with self.lock:
+            new_ids, records, vectors = [], [], []
+            for title, text in items:
+                text = text.strip()
+                if not text:
+                    continue
+                jd_id = hashlib.sha1(text.encode()).hexdigest()[:16]
+                if jd_id in self.id_set or jd_id in new_ids:
+                    continue
+                new_ids.append(jd_id)
+                records.append({"id": jd_id, "title": title or text.splitlines()[0][:80], "text": text})
+                vectors.append(hashed_term_vector(text, self.dim))
+
+            if not records:
+                return []
+
+            block = np.vstack(vectors).astype(np.float32)
+            with open(self.vectors_path, "ab") as f:
+                block.tofile(f)
+
+            offset = os.path.getsize(self.records_path) if os.path.exists(self.records_path) else 0
+            with open(self.records_path, "ab") as f:
+                for record in records:
+                    line = (json.dumps(record) + "\n").encode()
+                    f.write(line)
+                    self.ids.append(record["id"])
+                    self.titles.append(record["title"])
+                    self.offsets.append(offset)
+                    offset += len(line)
+            self.id_set.update(new_ids)
+
+            self.df += (block > 0).sum(axis=0)
+            tmp_path = self.df_path + ".tmp.npy"
+            np.save(tmp_path, self.df)
+            os.replace(tmp_path, self.df_path)
+
+            self._matrix = None  # re-map with the new row count on next query
+            return new_ids
+
+    def get(self, index):
+        with open(self.records_path, "rb") as f:
+            f.seek(self.offsets[index])
+            return json.loads(f.readline())
+
+    def idf(self):
+        """Smoothed IDF weight per hash bucket, from the document frequencies of the library."""
+        n = len(self.ids)
+        return (np.log((1 + n) / (1 + self.df)) + 1).astype(np.float32)
+
+    def top_k(self, resume_text, k=20):
+        """Cosine similarity (TF-IDF weighted) of the resume against every JD, best k first."""
+        with self.lock:
+            matrix = self.matrix()
+            n = matrix.shape[0]
+            if n == 0:
+                return []
+
+            idf = self.idf()
+            idf_sq = idf * idf
+            query = hashed_term_vector(resume_text, self.dim) * idf
+            query_norm = np.linalg.norm(query)
+            if query_norm == 0:
+                return []
+
+            # (d * idf) . (q * idf) / |d * idf| |q * idf|, computed chunk-wise over the memmap
+            weighted_query = query * idf
+            scores = np.empty(n, np.float32)
+            for start in range(0, n, SCAN_CHUNK_ROWS):
+                chunk = np.asarray(matrix[start:start + SCAN_CHUNK_ROWS])
+                doc_norms = np.sqrt((chunk * chunk) @ idf_sq)
+                doc_norms[doc_norms == 0] = 1
+                scores[start:start + len(chunk)] = (chunk @ weighted_query) / (doc_norms * query_norm)
+
+            k = min(k, n)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+
+        return [
+            {"index": int(i), "id": self.ids[i], "title": self.titles[i], "similarity": float(scores[i])}
+            for i in top
+        ]
+
+# ------------------- Bulk Import ------------------- #
+def parse_jd_upload(name, raw_bytes):
+    """Turn an uploaded .txt / .jsonl / .csv file into (title, text) pairs."""
+    content = raw_bytes.decode("utf-8", errors="ignore")
+    if name.endswith(".jsonl"):
+        items = []
+        for line in content.splitlines():
+            if line.strip():
+                record = json.loads(line)
+                items.append((record.get("title", ""), record.get("text") or record.get("description", "")))
+        return items
+    if name.endswith(".csv"):
+        import csv
+        import io
+        reader = csv.DictReader(io.StringIO(content))
+        return [(row.get("title", ""), row.get("text") or row.get("description", "")) for row in reader]
+    return [(os.path.splitext(name)[0], content)]
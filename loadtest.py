@@ -0,0 +1,292 @@
+"""
+Concurrent-session load test for the Streamlit app.
+
+Drives N simulated sessions through the real page scripts (Streamlit's AppTest runs
+them in-process, one session each): upload + analysis on Home, Deep Dive, a chat
+exchange and plan generation. Gemini is replaced by the stub backend with
+configurable latency. Measures server-side rerun time (script execution), not
+browser rendering or websocket transfer.
+
+    python loadtest.py --sessions 20 --latency-ms 800
+    python loadtest.py --sessions 20 --compare loadtest_results/<earlier run>.json
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import argparse
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+# share_server_state_between_sessions() patches Streamlit internals that change between
+# releases; results are only comparable on the version it was written against
+TESTED_STREAMLIT = "1.66."
+
+SAMPLE_JD = """Backend Engineer
+
+We are looking for a backend engineer to build and operate our APIs.
+
+Requirements:
+- 3+ years of Python and SQL
+- Experience with Docker and AWS
+- Strong communication and teamwork"""
+
+SAMPLE_RESUME_SECTIONS = {
+    "SUMMARY": "Software engineer with 4 years of experience building web services.",
+    "EXPERIENCE": "Backend Developer, Acme Corp (2021-2024)\nBuilt REST APIs in Python and PostgreSQL.\nMigrated services to Docker.",
+    "PROJECTS": "Resume Analyzer - Streamlit app scoring resumes against job descriptions.",
+    "SKILLS": "Python, SQL, Flask, Docker, Git, Communication",
+    "EDUCATION": "B.Tech in Computer Science, 2020",
+}
+
+# ------------------- Helpers ------------------- #
+def percentile(samples, pct):
+    if not samples:
+        return 0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))]
+
+def summarize_ms(samples):
+    return {
+        "count": len(samples),
+        "p50_ms": round(1000 * percentile(samples, 50), 1),
+        "p99_ms": round(1000 * percentile(samples, 99), 1),
+        "max_ms": round(1000 * max(samples), 1) if samples else 0,
+    }
+
+def sample_resume_pdf():
+    import fitz  # PyMuPDF
+    doc = fitz.open()
+    page = doc.new_page()
+    y = 72
+    for heading, body in SAMPLE_RESUME_SECTIONS.items():
+        for line in [heading] + body.splitlines():
+            page.insert_text((72, y), line)
+            y += 16
+        y += 10
+    return doc.tobytes()
+
+def streamlit_version():
+    import streamlit
+    return streamlit.__version__
+
+def current_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+class RSSSampler(threading.Thread):
+    """Polls process RSS in the background to catch the peak during the run."""
+
+    def __init__(self, interval=0.2):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.samples = []
+        self.running = True
+
+    def run(self):
+        from uploads import current_rss_mb
+        while self.running:
+            self.samples.append(current_rss_mb())
+            time.sleep(self.interval)
+
+    def stop(self):
+        self.running = False
+        self.join()
+
+def share_server_state_between_sessions():
+    """
+    AppTest builds a fresh mock Runtime and script bytecode cache for every run, and
+    resets the Runtime singleton and the pages-directory flag around it. That breaks
+    sessions running concurrently and recompiles each page on every rerun. Share one
+    of each instead, like a real server process does.
+    """
+    import streamlit
+    import streamlit.testing.v1.app_test as app_test
+    from streamlit.runtime.runtime import Runtime
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    if not streamlit.__version__.startswith(TESTED_STREAMLIT) and not os.getenv("LOADTEST_ANY_STREAMLIT"):
+        sys.exit(
+            f"loadtest.py patches Streamlit internals tested on {TESTED_STREAMLIT}x; found {streamlit.__version__}. "
+            "Re-check share_server_state_between_sessions() and update TESTED_STREAMLIT, "
+            "or set LOADTEST_ANY_STREAMLIT=1 to run anyway."
+        )
+    latest = {}
+
+    def instance(cls):
+        if cls._instance is not None:
+            latest["runtime"] = cls._instance
+        if "runtime" not in latest:
+            raise RuntimeError("Runtime hasn't been created!")
+        return latest["runtime"]
+
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(lambda cls: cls._instance is not None or "runtime" in latest)
+
+    shared_cache = ScriptCache()
+
+    def share_bytecode(cache):
+        cache._cache = shared_cache._cache
+        cache._lock = shared_cache._lock
+
+    ScriptCache.__init__ = share_bytecode
+
+    # AppTest clears PagesManager.uses_pages_directory before each run; point its reset
+    # at a subclass so the flag the page scripts read stays set
+    class SharedPagesManager(app_test.PagesManager):
+        pass
+
+    app_test.PagesManager = SharedPagesManager
+
+# ------------------- Simulated Session ------------------- #
+def find_button(at, label):
+    for button in at.button:
+        if button.label.strip() == label:
+            return button
+    raise LookupError(f"no {label!r} button on the page")
+
+def run_session(resume_pdf, timeout):
+    """One user's walk through the app. Returns {step: seconds} and any script errors."""
+    from streamlit.testing.v1 import AppTest
+
+    timings, errors = {}, []
+
+    def step(name, action):
+        started = time.perf_counter()
+        at = action()
+        timings[name] = time.perf_counter() - started
+        errors.extend(f"{name}: {e.value}" for e in at.exception)
+        return at
+
+    at = AppTest.from_file("Home.py", default_timeout=timeout)
+    try:
+        step("home_load", at.run)
+
+        at.file_uploader[0].set_value(("resume.pdf", resume_pdf, "application/pdf"))
+        at.text_area[0].input(SAMPLE_JD)
+        step("home_input", at.run)
+        step("analysis", find_button(at, "Start Analysis").click().run)
+
+        step("deep_dive", lambda: at.switch_page("pages/Deep_Dive.py").run())
+
+        step("chat_load", lambda: at.switch_page("pages/Chat_with_Resume.py").run())
+        at.file_uploader[0].set_value(("resume.pdf", resume_pdf, "application/pdf"))
+        step("chat_upload", at.run)
+        step("chat_answer", lambda: at.chat_input[0].set_value("How many years of Python experience do I have?").run())
+
+        step("plan_load", lambda: at.switch_page("pages/Preparation_Plan.py").run())
+        step("plan_generate", find_button(at, "Generate Preparation Plan").click().run)
+    except Exception as e:
+        # A page that failed to render is missing the widgets the next step needs
+        errors.append(f"session aborted after {len(timings)} steps: {type(e).__name__}: {e}")
+
+    return timings, errors
+
+# ------------------- Report ------------------- #
+def compare(report, baseline):
+    print(f"\nvs {baseline['commit']} ({baseline['config']['sessions']} sessions):")
+    before_version = baseline["config"].get("streamlit", "unknown")
+    if before_version != report["config"]["streamlit"]:
+        print(f"  warning: baseline ran on Streamlit {before_version}, this run on {report['config']['streamlit']}")
+    for key in ("throughput_sessions_per_s", "peak_rss_mb"):
+        print(f"  {key:28s} {baseline[key]:>10} -> {report[key]:>10}")
+    for name, now in report["rerun_latency"].items():
+        before = baseline["rerun_latency"].get(name)
+        if before:
+            print(f"  {name + ' p50/p99 ms':28s} {before['p50_ms']:>6}/{before['p99_ms']:<8} -> {now['p50_ms']:>6}/{now['p99_ms']}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=10, help="total simulated sessions")
+    parser.add_argument("--concurrency", type=int, default=None, help="sessions in flight at once (default: all)")
+    parser.add_argument("--latency-ms", type=float, default=500, help="stub Gemini latency per call")
+    parser.add_argument("--jitter-ms", type=float, default=100, help="stub Gemini latency standard deviation")
+    parser.add_argument("--rpm", type=float, default=100000, help="Gemini quota for the scheduler (default: effectively unlimited)")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed sessions run first so module imports don't skew results")
+    parser.add_argument("--timeout", type=float, default=120, help="per-rerun timeout in seconds")
+    parser.add_argument("--resume", help="PDF to upload (default: a generated sample resume)")
+    parser.add_argument("--output", help="JSON report path (default: loadtest_results/<commit>-<sessions>s.json)")
+    parser.add_argument("--compare", help="earlier JSON report to diff against")
+    args = parser.parse_args()
+    share_server_state_between_sessions()
+
+    # Must be set before the app modules are first imported by a page script.
+    # Session snapshots go to a throwaway database, not the app's sessions.db.
+    scratch_dir = tempfile.mkdtemp(prefix="loadtest-")
+    os.environ.update({
+        "SESSION_DB": os.path.join(scratch_dir, "sessions.db"),
+        "GEMINI_BACKEND": "stub",
+        "GEMINI_STUB_LATENCY_MS": str(args.latency_ms),
+        "GEMINI_STUB_JITTER_MS": str(args.jitter_ms),
+        "GEMINI_RPM": str(args.rpm),
+        "GEMINI_BURST": str(max(args.rpm / 60, 1)),
+    })
+    os.environ.pop("GEMINI_QUOTA_DB", None)
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, os.getcwd())
+
+    resume_pdf = open(args.resume, "rb").read() if args.resume else sample_resume_pdf()
+    concurrency = args.concurrency or args.sessions
+
+    for _ in range(args.warmup):
+        run_session(resume_pdf, args.timeout)
+
+    sampler = RSSSampler()
+    sampler.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda _: run_session(resume_pdf, args.timeout), range(args.sessions)))
+    elapsed = time.perf_counter() - started
+    sampler.stop()
+    shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    per_step = {}
+    for timings, _ in results:
+        for name, seconds in timings.items():
+            per_step.setdefault(name, []).append(seconds)
+    all_reruns = [s for samples in per_step.values() for s in samples]
+    errors = [e for _, errs in results for e in errs]
+
+    report = {
+        "commit": current_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "config": {
+            "sessions": args.sessions, "concurrency": concurrency, "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms, "rpm": args.rpm, "warmup": args.warmup, "python": sys.version.split()[0],
+            "streamlit": streamlit_version(),
+        },
+        "elapsed_s": round(elapsed, 2),
+        "throughput_sessions_per_s": round(args.sessions / elapsed, 3),
+        "throughput_reruns_per_s": round(len(all_reruns) / elapsed, 2),
+        "rerun_latency": {"all": summarize_ms(all_reruns), **{name: summarize_ms(s) for name, s in per_step.items()}},
+        "peak_rss_mb": round(max(sampler.samples, default=0), 1),
+        "final_rss_mb": round(sampler.samples[-1], 1) if sampler.samples else 0,
+        "errors": errors[:20],
+        "error_count": len(errors),
+    }
+
+    output = args.output or os.path.join("loadtest_results", f"{report['commit']}-{args.sessions}s.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"{args.sessions} sessions ({concurrency} concurrent) in {elapsed:.1f}s "
+          f"-> {report['throughput_sessions_per_s']} sessions/s, {report['throughput_reruns_per_s']} reruns/s")
+    print(f"peak RSS {report['peak_rss_mb']} MB, {len(errors)} script errors")
+    print(f"{'step':16s} {'p50 ms':>9s} {'p99 ms':>9s} {'max ms':>9s}")
+    for name, row in report["rerun_latency"].items():
+        print(f"{name:16s} {row['p50_ms']:>9} {row['p99_ms']:>9} {row['max_ms']:>9}")
+    print(f"report written to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
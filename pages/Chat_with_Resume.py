@@ -6,22 +6,25 @@ st.set_page_config(
     menu_items={}
 )
 
-import os
+from profiling import start_rerun
+from session_store import restore_session
+
+profiler = start_rerun("Chat")
+restore_session()
+
 import base64
- # PyMuPDF
-import google.generativeai as genai
-from dotenv import load_dotenv
 
-# ------------------- Configuration ------------------- # 
-load_dotenv()
+from analyzer import GEMINI_ENABLED, gemini_generate
+from answer_cache import cache_for_resume
+from chat_store import ChatTranscript
+from scheduler import Priority
+from uploads import UploadRejected, read_resume, upload_report_caption
 
-# Read API key directly from .env
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-if not GEMINI_API_KEY:
+# ------------------- Configuration ------------------- # 
+# analyzer loads .env and configures Gemini; every model call goes through gemini_generate
+if not GEMINI_ENABLED:
     st.error("❌ No Google API key found. Please set GOOGLE_API_KEY in your .env file.")
-else:
-    genai.configure(api_key=GEMINI_API_KEY)\
-    
+
 def get_base64_of_image(image_path):
     """Convert image to base64 to ensure it displays correctly in Streamlit."""
     with open(image_path, "rb") as img_file:
@@ -44,6 +47,7 @@ try:
 
 except FileNotFoundError:
     st.error("⚠ logo.png not found. Please ensure the logo file is in the same directory.")
+profiler.mark("logo")
 
 st.markdown("""
     <style>
@@ -95,7 +99,7 @@ a[data-testid="stPageLink-NavLink"] > span {
 """, unsafe_allow_html=True)
 
 # Navbar layout
-col1, col2, col3, col4 = st.columns(4)
+col1, col2, col3, col4, col5 = st.columns(5)
 
 with col1:
     st.page_link("Home.py", label="Home", icon="🛖")
@@ -105,19 +109,12 @@ with col3:
     st.page_link("pages/Deep_Dive.py", label="Deep Dive", icon="🔬")
 with col4:
     st.page_link("pages/Preparation_Plan.py", label="Plan", icon="📅")
-
-# ------------------- PDF Processing ------------------- # 
-@st.cache_data(show_spinner="📖 Extracting resume text...")
-def extract_text_cached(file_bytes):
-    doc = fitz.open(stream=file_bytes, filetype="pdf")
-    text = ""
-    for page in doc:
-        text += page.get_text()
-    return text.strip()
+with col5:
+    st.page_link("pages/Job_Matching.py", label="Job Match", icon="🎯")
+profiler.mark("navbar")
 
 # ------------------- Ask Gemini ------------------- # 
-def ask_gemini(history, resume_text, new_question):
-    chat_history = "\n".join(history)
+def ask_gemini(chat_history, resume_text, new_question, priority=Priority.CHAT):
     prompt = f"""
 You are an AI assistant that gives **detailed, step-by-step, professional answers** 
 based only on the given resume.
@@ -140,15 +137,13 @@ Rules:
 Q: {new_question}
 A:"""
 
-    model = genai.GenerativeModel("gemini-2.0-flash")
-    response = model.generate_content(prompt)
-    return response.text
+    return gemini_generate(prompt, priority)
 
 # ------------------- Streamlit App ------------------- #
 
 # ------------------- Initialize session state ------------------- #
-if "chat_history" not in st.session_state:
-    st.session_state.chat_history = []
+if st.session_state.get("chat_transcript") is None:
+    st.session_state.chat_transcript = ChatTranscript()
 if "resume_text" not in st.session_state:
     st.session_state.resume_text = None
 if "last_uploaded_file" not in st.session_state:
@@ -158,7 +153,7 @@ st.title("💬 Chat with Your Resume")
 
 # ------------------- Reset Button ------------------- #
 if st.button("🆕 New Chat"):
-    st.session_state.chat_history = []
+    st.session_state.chat_transcript = ChatTranscript()
     st.session_state.resume_text = None
     st.session_state.last_uploaded_file = None
     st.rerun()   # refresh app state immediately
@@ -171,41 +166,76 @@ if uploaded_file:
     if st.session_state.last_uploaded_file != uploaded_file.name:
         # Reset everything for new file
         st.session_state.resume_text = None
-        st.session_state.chat_history = []
+        st.session_state.chat_transcript = ChatTranscript()
         st.session_state.last_uploaded_file = uploaded_file.name
 
     if st.session_state.resume_text is None:
-        file_bytes = uploaded_file.read()
-        text = extract_text_cached(file_bytes)
+        try:
+            with st.spinner("📖 Extracting resume text..."):
+                text, report = read_resume(uploaded_file)
+        except UploadRejected as e:
+            st.warning(f"❌ {e}")
+            st.stop()
         if not text:
             st.warning("❌ The resume has no readable text.")
             st.stop()
         st.session_state.resume_text = text
         st.success("✅ Resume uploaded and processed!")
+        st.caption(upload_report_caption(report))
+        profiler.mark("pdf_extraction")
 
 # ------------------- Chat Interface ------------------- #
 if st.session_state.resume_text:
-    # Display previous messages
-    for entry in st.session_state.chat_history:
-        if entry.startswith("Q:"):
-            st.chat_message("user").write(entry[2:].strip())
-        elif entry.startswith("A:"):
-            st.chat_message("assistant").write(entry[2:].strip())
+    # Warm the answer cache with common questions while the user reads / types. This runs
+    # wherever the resume came from (upload here, Home's analysis or a restored session);
+    # precompute() only starts once per resume. session_state is not readable from the
+    # background thread, so bind the text now.
+    resume_text = st.session_state.resume_text
+    cache_for_resume(resume_text).precompute(lambda question: ask_gemini("", resume_text, question, Priority.BACKGROUND))
+
+    transcript = st.session_state.chat_transcript
+
+    # Older turns stay collapsed; only the recent window is rendered on every rerun
+    if transcript.older_count():
+        st.caption(f"{transcript.older_count()} earlier messages hidden · ~{transcript.total_tokens} tokens in this chat")
+        if st.toggle("📜 Show earlier messages", key="show_older_messages"):
+            page = 0
+            if transcript.page_count() > 1:
+                page = st.number_input("Page", min_value=1, max_value=transcript.page_count(), value=transcript.page_count()) - 1
+            for message in transcript.older_page(page):
+                st.chat_message(message["role"]).write(message["content"])
+            st.divider()
+
+    # Display recent messages
+    for message in transcript.recent():
+        st.chat_message(message["role"]).write(message["content"])
+
+    profiler.mark("history_render")
 
     # Chat input
     user_input = st.chat_input("Ask something about the resume...")
 
     if user_input:
         st.chat_message("user").write(user_input)
-        st.session_state.chat_history.append(f"Q: {user_input}")
+        chat_history = transcript.prompt_history()
+        transcript.add("user", user_input)
 
+        answer_cache = cache_for_resume(st.session_state.resume_text)
         with st.chat_message("assistant"):
-            response = ask_gemini(
-                st.session_state.chat_history,
-                st.session_state.resume_text,
-                user_input,
-            )
+            response = answer_cache.lookup(user_input)
+            if response is None:
+                response = ask_gemini(
+                    chat_history,
+                    st.session_state.resume_text,
+                    user_input,
+                )
+                answer_cache.store(user_input, response)
+            else:
+                st.caption("⚡ Answered from cache")
             st.write(response)
-            st.session_state.chat_history.append(f"A: {response}")
+            transcript.add("assistant", response)
+        profiler.mark("llm_answer")
 else:
-    st.info("⬆️ Please upload your resume above to start chatting.")
\ No newline at end of file
+    st.info("⬆️ Please upload your resume above to start chatting.")
+
+profiler.render()
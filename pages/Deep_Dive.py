@@ -9,6 +9,14 @@ st.set_page_config(
     menu_items={}
 )
 
+from profiling import start_rerun
+from session_store import restore_session
+
+profiler = start_rerun("Deep_Dive")
+restore_session()
+
+from incremental_analysis import matches
+
 def get_base64_of_image(image_path):
     """Convert image to base64 to ensure it displays correctly in Streamlit."""
     with open(image_path, "rb") as img_file:
@@ -31,6 +39,7 @@ try:
 
 except FileNotFoundError:
     st.error("⚠ logo.png not found. Please ensure the logo file is in the same directory.")
+profiler.mark("logo")
 
 st.markdown("""
     <style>
@@ -82,7 +91,7 @@ a[data-testid="stPageLink-NavLink"] > span {
 """, unsafe_allow_html=True)
 
 # Navbar layout
-col1, col2, col3, col4 = st.columns(4)
+col1, col2, col3, col4, col5 = st.columns(5)
 
 with col1:
     st.page_link("Home.py", label="Home", icon="🛖")
@@ -92,12 +101,12 @@ with col3:
     st.page_link("pages/Deep_Dive.py", label="Deep Dive", icon="🔬")
 with col4:
     st.page_link("pages/Preparation_Plan.py", label="Plan", icon="📅")
+with col5:
+    st.page_link("pages/Job_Matching.py", label="Job Match", icon="🎯")
+profiler.mark("navbar")
 
 st.title("🔬 Deep Dive Report")
 
-def matches(required, present_list):
-    return any(required.lower() in p.lower() or p.lower() in required.lower() for p in present_list)
-
 def generate_extra_insights():
     insights = []
 
@@ -107,8 +116,8 @@ def generate_extra_insights():
     tech_req = set(st.session_state.get("technical_skills_required", []))
     tech_pres = set(st.session_state.get("technical_skills_present", []))
 
-    soft_coverage = (len([s for s in soft_req if any(s.lower() in p.lower() or p.lower() in s.lower() for p in soft_pres)]) / len(soft_req) * 100) if soft_req else 0
-    tech_coverage = (len([t for t in tech_req if any(t.lower() in p.lower() or p.lower() in t.lower() for p in tech_pres)]) / len(tech_req) * 100) if tech_req else 0
+    soft_coverage = (len([s for s in soft_req if matches(s, soft_pres)]) / len(soft_req) * 100) if soft_req else 0
+    tech_coverage = (len([t for t in tech_req if matches(t, tech_pres)]) / len(tech_req) * 100) if tech_req else 0
 
     insights.append(f"Soft skills coverage: **{soft_coverage:.1f}%** ({len(soft_req)} required, {len(soft_pres)} present)")
     insights.append(f"Technical skills coverage: **{tech_coverage:.1f}%** ({len(tech_req)} required, {len(tech_pres)} present)")
@@ -122,13 +131,13 @@ def generate_extra_insights():
         insights.append("Profile shows **balanced soft and technical skills**.")
 
     # --- Critical Gaps ---
-    critical_missing = [r for r in tech_req if not any(r.lower() in p.lower() or p.lower() in r.lower() for p in tech_pres)]
+    critical_missing = [r for r in tech_req if not matches(r, tech_pres)]
     if critical_missing:
         insights.append("⚠️ Critical technical gaps: " + ", ".join(critical_missing))
 
     # --- Extra Skills ---
-    extra_tech = [p for p in tech_pres if not any(r.lower() in p.lower() or p.lower() in r.lower() for r in tech_req)]
-    extra_soft = [p for p in soft_pres if not any(r.lower() in p.lower() or p.lower() in r.lower() for r in soft_req)]
+    extra_tech = [p for p in tech_pres if not matches(p, tech_req)]
+    extra_soft = [p for p in soft_pres if not matches(p, soft_req)]
     if extra_tech or extra_soft:
         extras = extra_tech + extra_soft
         insights.append("Candidate brings **extra skills** not in JD: " + ", ".join(extras))
@@ -147,7 +156,7 @@ def generate_extra_insights():
         insights.append("✅ Candidate is aligned with modern tech stack trends: " + ", ".join(modern_present))
 
     fundamentals = {"java", "dsa", "data structures", "algorithms"}
-    missing_fundamentals = [f for f in fundamentals if not any(f.lower() in p.lower() or p.lower() in f.lower() for p in tech_pres)]
+    missing_fundamentals = [f for f in fundamentals if not matches(f, tech_pres)]
     if missing_fundamentals:
         insights.append("⚠️ Missing core fundamentals: " + ", ".join(missing_fundamentals))
 
@@ -196,6 +205,8 @@ if st.session_state.get("analysis_done", False):
             else:
                 st.success("All required technical skills are covered.")
 
+    profiler.mark("skills_gap")
+
     st.markdown("---")
 
     # --- Recommendations ---
@@ -215,8 +226,11 @@ if st.session_state.get("analysis_done", False):
     st.subheader("Extra Insights")
     with st.container(border=True):
         st.markdown(generate_extra_insights())
+    profiler.mark("extra_insights")
 
 
 else:
     st.warning("⚠️ Please run an analysis on the Dashboard first.")
-    st.page_link("home.py", label="🏠 Go to Dashboard", icon="🏠")
+    st.page_link("Home.py", label="🏠 Go to Dashboard", icon="🏠")
+
+profiler.render()
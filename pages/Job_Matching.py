@@ -0,0 +1,215 @@
+import streamlit as st
+import base64
+
+
+st.set_page_config(
+    page_title="Job Matching",
+    page_icon="🎯",
+    layout="wide",
+    menu_items={}
+)
+
+from profiling import start_rerun
+from session_store import restore_session
+
+profiler = start_rerun("Job_Matching")
+restore_session()
+
+def get_base64_of_image(image_path):
+    """Convert image to base64 to ensure it displays correctly in Streamlit."""
+    with open(image_path, "rb") as img_file:
+        return base64.b64encode(img_file.read()).decode()
+
+try:
+    logo_base64 = get_base64_of_image("logo.png")  # Make sure 'logo.png' is in the same folder
+    st.markdown(
+    f"""
+    <div style='display: flex; align-items: center; justify-content: center; gap: 20px; margin-bottom: 20px;'>
+        <img src='data:image/png;base64,{logo_base64}'
+             style='width:110px; height:110px; border-radius:50%; object-fit:contain;'>
+        <h1 style='color: #D9D9D9; font-family: "Segoe UI", sans-serif; font-size: 42px; margin: 0;'>
+            Smart Resume Analyzer
+        </h1>
+    </div>
+    """,
+    unsafe_allow_html=True
+)
+
+except FileNotFoundError:
+    st.error("⚠ logo.png not found. Please ensure the logo file is in the same directory.")
+profiler.mark("logo")
+
+st.markdown("""
+    <style>
+        /* Remove sidebar and its toggle completely */
+        [data-testid="stSidebar"], [data-testid="collapsedControl"] {
+            display: none !important;
+        }
+        /* Make app full-width */
+        .block-container {
+            padding-left: 3rem !important;
+            padding-right: 3rem !important;
+            max-width: 100% !important;
+        }
+    </style>
+""", unsafe_allow_html=True)
+
+st.markdown("""
+<style>
+
+div[data-testid="stHorizontalBlock"] {
+    display: flex;
+    justify-content: center;
+    padding: 12px 0;
+    border-radius: 12px;
+    box-shadow: 0 4px 10px rgba(0, 0, 0, 0.3);
+    margin-bottom: 25px;
+}
+
+a[data-testid="stPageLink-NavLink"] {
+    color: #E0E0E0 !important;  /* Whitish grey text */
+    font-weight: 600;
+    font-size: 18px;
+    text-decoration: none;
+    padding: 10px 25px;
+    border-radius: 10px;
+    transition: all 0.3s ease;
+}
+
+a[data-testid="stPageLink-NavLink"]:hover {
+    background-color: #333333;
+    color: #FFFFFF !important;
+    transform: scale(1.05);
+}
+
+a[data-testid="stPageLink-NavLink"] > span {
+    margin-right: 6px;
+}
+</style>
+""", unsafe_allow_html=True)
+
+# Navbar layout
+col1, col2, col3, col4, col5 = st.columns(5)
+
+with col1:
+    st.page_link("Home.py", label="Home", icon="🛖")
+with col2:
+    st.page_link("pages/Chat_with_Resume.py", label="Chat", icon="💬")
+with col3:
+    st.page_link("pages/Deep_Dive.py", label="Deep Dive", icon="🔬")
+with col4:
+    st.page_link("pages/Preparation_Plan.py", label="Plan", icon="📅")
+with col5:
+    st.page_link("pages/Job_Matching.py", label="Job Match", icon="🎯")
+profiler.mark("navbar")
+
+import cascade
+from jd_library import JDLibrary, parse_jd_upload
+from uploads import UploadRejected, read_resume
+
+st.title("🎯 Match Resume Against Job Library")
+
+@st.cache_resource
+def get_library():
+    # One index per server process, shared by every session
+    return JDLibrary()
+
+library = get_library()
+profiler.mark("library_load")
+
+# ------------------- Session State ------------------- #
+if "match_resume_text" not in st.session_state:
+    st.session_state.match_resume_text = None
+if "match_shortlist" not in st.session_state:
+    st.session_state.match_shortlist = []
+if "match_scores" not in st.session_state:
+    st.session_state.match_scores = {}
+
+# ------------------- Add JDs to Library ------------------- #
+with st.expander(f"📚 Job Library ({len(library)} JDs indexed)"):
+    jd_files = st.file_uploader(
+        "Upload JDs (.txt for one JD, .jsonl / .csv with `title` and `text` columns for many)",
+        type=["txt", "jsonl", "csv"],
+        accept_multiple_files=True,
+    )
+    new_title = st.text_input("Or add a single JD — title")
+    new_text = st.text_area("Job Description", height=150)
+
+    if st.button("Add to Library"):
+        items = []
+        for jd_file in jd_files or []:
+            items.extend(parse_jd_upload(jd_file.name, jd_file.read()))
+        if new_text.strip():
+            items.append((new_title, new_text))
+        added = library.add_many(items)
+        st.success(f"✅ Added {len(added)} new JDs ({len(items) - len(added)} skipped as empty or duplicate).")
+
+# ------------------- Resume Shortlisting ------------------- #
+st.markdown("### 📎 Upload Resume")
+resume_file = st.file_uploader("", type="pdf", key="match_resume")
+top_k = st.slider("Shortlist size", min_value=1, max_value=50, value=10)
+
+if st.button("Find Best Matches", disabled=len(library) == 0):
+    if resume_file:
+        try:
+            st.session_state.match_resume_text, _ = read_resume(resume_file)
+        except UploadRejected as e:
+            st.error(f"⚠ {e}")
+            st.stop()
+        st.session_state.match_shortlist = library.top_k(st.session_state.match_resume_text, k=top_k)
+        profiler.mark("shortlist")
+        st.session_state.match_scores = {}
+    else:
+        st.warning("⚠ Please upload a resume first.")
+
+if st.session_state.match_shortlist:
+    st.subheader("📋 Shortlist")
+    st.dataframe(
+        [
+            {
+                "Job": m["title"],
+                "Similarity": round(m["similarity"] * 100, 1),
+                # Local-tier results have no model score, only a verdict
+                "Score": st.session_state.match_scores.get(m["id"], {}).get("overall_score"),
+                "Verdict": st.session_state.match_scores.get(m["id"], {}).get("verdict"),
+                "Scored By": st.session_state.match_scores.get(m["id"], {}).get("tier"),
+            }
+            for m in st.session_state.match_shortlist
+        ],
+        use_container_width=True,
+    )
+
+    # Only the shortlisted JDs are scored, each by the cheapest confident tier
+    if st.button("Score Shortlist"):
+        progress = st.progress(0.0)
+        shortlist = st.session_state.match_shortlist
+        idf = library.idf()
+        for n, m in enumerate(shortlist, 1):
+            if m["id"] not in st.session_state.match_scores:
+                jd_text = library.get(m["index"])["text"]
+                st.session_state.match_scores[m["id"]] = cascade.evaluate(st.session_state.match_resume_text, jd_text, idf)
+            progress.progress(n / len(shortlist))
+        profiler.mark("scoring")
+        st.rerun()
+
+    for m in st.session_state.match_shortlist:
+        result = st.session_state.match_scores.get(m["id"])
+        if result and ("overall_score" in result or "verdict" in result):
+            label = f"{result['overall_score']}%" if "overall_score" in result else f"{result['verdict']} (screened locally)"
+            with st.expander(f"{m['title']} — {label}"):
+                st.write(result.get("feedback", "No feedback provided"))
+
+# ------------------- Cascade Stats ------------------- #
+with st.expander("🪜 Scoring Tiers"):
+    st.caption(
+        "Local similarity settles clear rejects/accepts, the lite model the middle band, "
+        "and the full model only borderline cases. Latency includes the tiers tried before."
+    )
+    limits = cascade.DEFAULT_THRESHOLDS
+    st.caption(
+        f"Local cutoffs: reject below {limits['local_reject']:.2f}, accept from {limits['local_accept']:.2f} similarity. "
+        "These are placeholders; re-tune them for this library with CASCADE_LOCAL_REJECT / CASCADE_LOCAL_ACCEPT."
+    )
+    st.dataframe(cascade.stats.summary(), use_container_width=True)
+
+profiler.render()
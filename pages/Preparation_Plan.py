@@ -8,8 +8,14 @@ st.set_page_config(
     menu_items={}
 )
 
-import google.generativeai as genai
-import os
+from profiling import start_rerun
+from session_store import persist_session, restore_session
+
+profiler = start_rerun("Plan")
+restore_session()
+
+from analyzer import GEMINI_ENABLED, gemini_generate
+from scheduler import Priority
 
 def get_base64_of_image(image_path):
     """Convert image to base64 to ensure it displays correctly in Streamlit."""
@@ -33,6 +39,7 @@ try:
 
 except FileNotFoundError:
     st.error("⚠ logo.png not found. Please ensure the logo file is in the same directory.")
+profiler.mark("logo")
 
 st.markdown("""
     <style>
@@ -84,7 +91,7 @@ a[data-testid="stPageLink-NavLink"] > span {
 """, unsafe_allow_html=True)
 
 # Navbar layout
-col1, col2, col3, col4 = st.columns(4)
+col1, col2, col3, col4, col5 = st.columns(5)
 
 with col1:
     st.page_link("Home.py", label="Home", icon="🛖")
@@ -94,6 +101,9 @@ with col3:
     st.page_link("pages/Deep_Dive.py", label="Deep Dive", icon="🔬")
 with col4:
     st.page_link("pages/Preparation_Plan.py", label="Plan", icon="📅")
+with col5:
+    st.page_link("pages/Job_Matching.py", label="Job Match", icon="🎯")
+profiler.mark("navbar")
 
 st.title("📅 Preparation Plan")
 
@@ -120,10 +130,8 @@ else:
         st.session_state.prep_plan_text = None  # Clear old plan when days change
     
     if st.button("Generate Preparation Plan"):
-        if os.getenv("GEMINI_API_KEY"):
+        if GEMINI_ENABLED:
             with st.spinner("Generating your personalized preparation plan..."):
-                genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-                model = genai.GenerativeModel("gemini-2.0-flash")
                 prompt = f"""
                 Resume: {st.session_state.resume_text[:1500]}
                 Job Description: {st.session_state.jd_text[:1500]}
@@ -134,11 +142,13 @@ else:
                 - Missing areas to improve
                 - Daily/weekly schedule
                 """
-                response = model.generate_content(prompt)
+                plan_text = gemini_generate(prompt, Priority.BACKGROUND)
+                profiler.mark("plan_generation")
                 
                 # Store the generated plan in session state
-                st.session_state.prep_plan_text = response.text
+                st.session_state.prep_plan_text = plan_text
                 st.session_state.prep_days = days
+                persist_session()
             st.rerun()
         else:
             st.error("Gemini API key not configured. Cannot generate plan.")
@@ -146,4 +156,6 @@ else:
     # Display stored preparation plan if it exists
     if st.session_state.prep_plan_text:
         st.success("✅ Preparation Plan Generated")
-        st.write(st.session_state.prep_plan_text)
\ No newline at end of file
+        st.write(st.session_state.prep_plan_text)
+
+profiler.render()
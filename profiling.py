@@ -0,0 +1,123 @@
+import os
+import time
+import cProfile
+import threading
+from collections import defaultdict, deque
+
+import streamlit as st
+
+# ------------------- Configuration ------------------- #
+PROFILE_PAGES = os.getenv("PROFILE_PAGES") == "1"          # or add ?profile=1 to the URL
+PROFILE_SLOW_MS = float(os.getenv("PROFILE_SLOW_MS", "2000"))  # reruns slower than this get a pstats dump
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+TIMING_SAMPLES = 500
+
+# Process-wide timings, so the breakdown aggregates across every session
+_timings = defaultdict(lambda: deque(maxlen=TIMING_SAMPLES))
+_timings_lock = threading.Lock()
+
+def aggregate(page):
+    with _timings_lock:
+        rows = []
+        for (timed_page, section), samples in _timings.items():
+            if timed_page != page:
+                continue
+            ordered = sorted(samples)
+            rows.append({
+                "section": section,
+                "runs": len(ordered),
+                "mean_ms": round(sum(ordered) / len(ordered), 1),
+                "p50_ms": round(ordered[len(ordered) // 2], 1),
+                "p95_ms": round(ordered[round(0.95 * (len(ordered) - 1))], 1),
+            })
+    return rows
+
+# ------------------- Per-Rerun Profiler ------------------- #
+class RerunProfiler:
+    """
+    Times named sections of one script run; a no-op unless profiling is enabled.
+    Pages call mark(name) after each block, so a section is the time since the previous mark.
+    """
+
+    def __init__(self, page, enabled):
+        self.page = page
+        self.enabled = enabled
+        self.sections = []
+        self.started = time.perf_counter()
+        self.last_mark = self.started
+        self.total_ms = 0
+        self.finished = False
+        self.interrupted = False
+        self.dump_path = None
+        self.previous = None
+        self.profile = None
+        if enabled:
+            try:
+                self.profile = cProfile.Profile()
+                self.profile.enable()
+            except ValueError:  # another session's profiler holds the hook (Python 3.12+)
+                self.profile = None
+
+    def mark(self, name):
+        if not self.enabled or self.finished:
+            return
+        now = time.perf_counter()
+        self.sections.append((name, 1000 * (now - self.last_mark)))
+        self.last_mark = now
+
+    def finish(self, interrupted=False):
+        if not self.enabled or self.finished:
+            return
+        self.finished = True
+        self.interrupted = interrupted
+        # A run cut short by st.rerun()/st.stop() is closed by the next run, so it ends at its last mark
+        ended = self.last_mark if interrupted else time.perf_counter()
+        self.total_ms = 1000 * (ended - self.started)
+
+        if self.profile is not None:
+            self.profile.disable()
+            if self.total_ms >= PROFILE_SLOW_MS:
+                os.makedirs(PROFILE_DIR, exist_ok=True)
+                self.dump_path = os.path.join(PROFILE_DIR, f"{self.page}-{time.strftime('%Y%m%d-%H%M%S')}-{int(self.total_ms)}ms.pstats")
+                self.profile.dump_stats(self.dump_path)
+            self.profile = None
+
+        with _timings_lock:
+            for name, ms in self.sections:
+                _timings[(self.page, name)].append(ms)
+            _timings[(self.page, "total")].append(self.total_ms)
+
+    def breakdown(self):
+        rows = [{"section": name, "ms": round(ms, 1)} for name, ms in self.sections]
+        rows.append({"section": "other", "ms": round(max(self.total_ms - sum(ms for _, ms in self.sections), 0), 1)})
+        return rows
+
+    def render(self):
+        """Finish the run and show this rerun's timings plus cross-session aggregates."""
+        if not self.enabled:
+            return
+        self.finish()
+        with st.expander(f"⏱ Profile: {self.page} rerun took {self.total_ms:.0f} ms"):
+            st.dataframe(self.breakdown(), use_container_width=True)
+            if self.previous is not None:
+                st.caption(f"Previous rerun (ended early by st.rerun/st.stop): {self.previous.total_ms:.0f} ms")
+                st.dataframe(self.previous.breakdown(), use_container_width=True)
+            for run in (self, self.previous):
+                if run is not None and run.dump_path:
+                    st.caption(f"cProfile dump written to `{run.dump_path}` (open with `python -m pstats`).")
+            st.caption("All sessions since server start:")
+            st.dataframe(aggregate(self.page), use_container_width=True)
+
+
+def start_rerun(page):
+    """Call once at the top of a page script; returns the profiler for this run."""
+    enabled = PROFILE_PAGES or st.query_params.get("profile") == "1"
+    previous = st.session_state.get("_profiler")
+    if previous is not None and not previous.finished:
+        previous.finish(interrupted=True)
+    profiler = RerunProfiler(page, enabled)
+    if previous is not None and previous.interrupted:
+        previous.previous = None
+        profiler.previous = previous
+    st.session_state["_profiler"] = profiler
+    return profiler
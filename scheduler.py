@@ -0,0 +1,160 @@
+import os
+import time
+import heapq
+import sqlite3
+import itertools
+import threading
+from enum import IntEnum
+from collections import deque
+
+# ------------------- Configuration ------------------- #
+GEMINI_RPM = float(os.getenv("GEMINI_RPM", "15"))       # sustained requests per minute for the shared key
+GEMINI_BURST = float(os.getenv("GEMINI_BURST", "5"))    # requests allowed back-to-back
+GEMINI_QUOTA_DB = os.getenv("GEMINI_QUOTA_DB")          # set to share the bucket across server processes
+WAIT_SAMPLES = 500                                      # recent wait times kept per priority
+
+
+class Priority(IntEnum):
+    CHAT = 0          # a user is waiting on the reply
+    ANALYSIS = 1      # resume / JD scoring
+    BACKGROUND = 2    # plan generation, cache warm-up
+
+
+class QuotaWaitTimeout(RuntimeError):
+    """Raised when a model call could not get a quota token within its timeout."""
+
+# ------------------- Token Buckets ------------------- #
+class LocalBucket:
+    def __init__(self, rate_per_sec, capacity):
+        self.rate = rate_per_sec
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def try_take(self):
+        """Take one token if available. Returns 0 on success, else seconds until one is available."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+    def available(self):
+        return min(self.capacity, self.tokens + (time.monotonic() - self.updated) * self.rate)
+
+
+class SQLiteBucket:
+    """Same bucket, with its state in a SQLite row so several server processes share one quota."""
+
+    def __init__(self, rate_per_sec, capacity, path):
+        self.rate = rate_per_sec
+        self.capacity = capacity
+        self.path = path
+        with self._connect() as db:
+            db.execute("CREATE TABLE IF NOT EXISTS bucket (id INTEGER PRIMARY KEY, tokens REAL, updated REAL)")
+            db.execute("INSERT OR IGNORE INTO bucket VALUES (1, ?, ?)", (capacity, time.time()))
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=10, isolation_level=None)
+
+    def _refill(self, db):
+        tokens, updated = db.execute("SELECT tokens, updated FROM bucket WHERE id = 1").fetchone()
+        now = time.time()
+        return min(self.capacity, tokens + (now - updated) * self.rate), now
+
+    def try_take(self):
+        db = self._connect()
+        try:
+            db.execute("BEGIN IMMEDIATE")  # write lock held across read-modify-write
+            tokens, now = self._refill(db)
+            wait = 0 if tokens >= 1 else (1 - tokens) / self.rate
+            if tokens >= 1:
+                tokens -= 1
+            db.execute("UPDATE bucket SET tokens = ?, updated = ? WHERE id = 1", (tokens, now))
+            db.execute("COMMIT")
+            return wait
+        finally:
+            db.close()
+
+    def available(self):
+        db = self._connect()
+        try:
+            return self._refill(db)[0]
+        finally:
+            db.close()
+
+# ------------------- Priority Scheduler ------------------- #
+class QuotaScheduler:
+    """
+    Token-bucket rate limiter with a priority queue in front of it. Callers block in
+    acquire() until they are the highest-priority (then oldest) waiter in this process
+    and a token is free. With a SQLite bucket the token count is shared between
+    processes, while priority ordering applies within each process.
+    """
+
+    def __init__(self, bucket):
+        self.bucket = bucket
+        self.cond = threading.Condition()
+        self.queue = []
+        self.counter = itertools.count()
+        self.waits = {p: deque(maxlen=WAIT_SAMPLES) for p in Priority}
+        self.granted = {p: 0 for p in Priority}
+
+    @classmethod
+    def from_env(cls):
+        rate = GEMINI_RPM / 60
+        bucket = SQLiteBucket(rate, GEMINI_BURST, GEMINI_QUOTA_DB) if GEMINI_QUOTA_DB else LocalBucket(rate, GEMINI_BURST)
+        return cls(bucket)
+
+    def acquire(self, priority=Priority.ANALYSIS, timeout=None):
+        """Block until this call may hit the model. Returns the time spent waiting, in seconds."""
+        ticket = (int(priority), next(self.counter))
+        start = time.monotonic()
+        with self.cond:
+            heapq.heappush(self.queue, ticket)
+            try:
+                while True:
+                    remaining = None if timeout is None else timeout - (time.monotonic() - start)
+                    if remaining is not None and remaining <= 0:
+                        raise QuotaWaitTimeout(f"No Gemini quota available within {timeout:g}s")
+                    if self.queue[0] == ticket:
+                        retry_in = self.bucket.try_take()
+                        if retry_in == 0:
+                            break
+                        # Cap the sleep so other processes sharing the bucket are re-checked
+                        delay = min(retry_in, 1.0)
+                    else:
+                        delay = None
+                    if remaining is not None:
+                        delay = remaining if delay is None else min(delay, remaining)
+                    self.cond.wait(delay)
+            finally:
+                self.queue.remove(ticket)
+                heapq.heapify(self.queue)
+                self.cond.notify_all()
+
+            waited = time.monotonic() - start
+            self.waits[Priority(priority)].append(waited)
+            self.granted[Priority(priority)] += 1
+        return waited
+
+    def stats(self):
+        """Queue depth and wait-time distribution per priority class, for capacity sizing."""
+        with self.cond:
+            depth = {p.name.lower(): sum(1 for t in self.queue if t[0] == p) for p in Priority}
+            waits = {}
+            for p in Priority:
+                samples = sorted(self.waits[p])
+                waits[p.name.lower()] = {
+                    "granted": self.granted[p],
+                    "mean_ms": round(1000 * sum(samples) / len(samples), 1) if samples else 0,
+                    "p95_ms": round(1000 * samples[round(0.95 * (len(samples) - 1))], 1) if samples else 0,
+                    "max_ms": round(1000 * samples[-1], 1) if samples else 0,
+                }
+        return {"queue_depth": depth, "wait": waits, "tokens_available": round(self.bucket.available(), 2)}
+
+
+# One scheduler per server process, shared by every session
+quota = QuotaScheduler.from_env()
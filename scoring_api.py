@@ -0,0 +1,259 @@
+"""
+HTTP scoring API for other services (ATS, nightly jobs), without a Streamlit rerun and
+websocket per request. It uses the app's PDF extraction (read_resume) and returns the
+final_score_with_gemini JSON: one whole-document call per resume/JD pair.
+
+This is not the analysis Home runs. Home uses analyze_incremental, which builds the
+same keys from per-section calls and a summary call, so the two can score the same
+pair differently. Use one of them consistently when comparing scores.
+
+Model calls go through the same quota scheduler; set GEMINI_QUOTA_DB to share the
+Gemini budget with the app's processes.
+
+    GEMINI_BACKEND=stub python scoring_api.py --port 8600
+
+    curl -F resume=@resume.pdf -F jd="$(cat jd.txt)" localhost:8600/score
+    curl -F resume=@a.pdf -F resume=@b.pdf -F jd="$(cat jd.txt)" localhost:8600/score/batch
+    curl localhost:8600/health
+    curl localhost:8600/metrics
+"""
+import os
+import time
+import asyncio
+import hashlib
+import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from analyzer import GEMINI_BACKEND, GEMINI_ENABLED, final_score_with_gemini
+from scheduler import quota
+from uploads import MAX_UPLOAD_MB, UploadRejected, current_rss_mb, read_resume
+
+# ------------------- Configuration ------------------- #
+SCORING_CONCURRENCY = int(os.getenv("SCORING_CONCURRENCY", "4"))   # model calls in flight at once
+SCORING_MAX_WAITING = int(os.getenv("SCORING_MAX_WAITING", "64"))  # queued scores before answering 503
+SCORING_BATCH_MAX = int(os.getenv("SCORING_BATCH_MAX", "20"))      # resumes per /score/batch request
+RESULT_CACHE_SIZE = 256                                            # recent scores kept per process
+LATENCY_SAMPLES = 1000                                             # per endpoint, for p50/p99
+
+
+class Overloaded(Exception):
+    """More scores are waiting than SCORING_MAX_WAITING; the client should retry later."""
+
+# ------------------- Scoring ------------------- #
+class Scorer:
+    """
+    Runs final_score_with_gemini on a bounded thread pool. Identical resume/JD pairs
+    that are already in flight share one model call, and recent results are reused.
+    """
+
+    def __init__(self, concurrency=SCORING_CONCURRENCY, max_waiting=SCORING_MAX_WAITING):
+        self.concurrency = concurrency
+        self.max_waiting = max_waiting
+        self.model_pool = ThreadPoolExecutor(concurrency, thread_name_prefix="score")
+        self.extract_pool = ThreadPoolExecutor(concurrency, thread_name_prefix="extract")
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.in_flight = {}   # pair hash -> future shared by identical requests
+        self.results = {}     # pair hash -> result, oldest dropped first
+        self.waiting = 0
+        self.running = 0
+        self.counts = {"model_calls": 0, "coalesced": 0, "cache_hits": 0, "rejected": 0}
+
+    async def extract(self, upload):
+        loop = asyncio.get_running_loop()
+        text, _ = await loop.run_in_executor(self.extract_pool, read_resume, upload.file, upload.size or 0)
+        if not text:
+            raise UploadRejected("The resume has no readable text.")
+        return text
+
+    async def score(self, resume_text, jd_text):
+        key = hashlib.sha1(f"{resume_text}\0{jd_text}".encode()).hexdigest()
+        if key in self.results:
+            self.counts["cache_hits"] += 1
+            return self.results[key]
+        if key in self.in_flight:
+            self.counts["coalesced"] += 1
+            return await asyncio.shield(self.in_flight[key])
+        if self.waiting >= self.max_waiting:
+            self.counts["rejected"] += 1
+            raise Overloaded(f"{self.waiting} scores already waiting")
+
+        future = asyncio.get_running_loop().create_future()
+        self.in_flight[key] = future
+        try:
+            result = await self._run(resume_text, jd_text)
+            if "error" not in result:
+                self.results[key] = result
+                while len(self.results) > RESULT_CACHE_SIZE:
+                    self.results.pop(next(iter(self.results)))
+            future.set_result(result)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody else was waiting on it
+            raise
+        finally:
+            del self.in_flight[key]
+        return result
+
+    async def _run(self, resume_text, jd_text):
+        self.waiting += 1
+        try:
+            await self.semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.running += 1
+        self.counts["model_calls"] += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.model_pool, final_score_with_gemini, resume_text, jd_text)
+        finally:
+            self.running -= 1
+            self.semaphore.release()
+
+    def stats(self):
+        return {
+            "concurrency": self.concurrency,
+            "running": self.running,
+            "waiting": self.waiting,
+            "cached_results": len(self.results),
+            **self.counts,
+        }
+
+
+scorer = Scorer()
+
+# ------------------- Request Metrics ------------------- #
+class RequestMetrics:
+    def __init__(self):
+        self.started = time.time()
+        self.counts = {}
+        self.latencies = {}
+
+    def record(self, endpoint, status, seconds):
+        counts = self.counts.setdefault(endpoint, {})
+        counts[status] = counts.get(status, 0) + 1
+        self.latencies.setdefault(endpoint, deque(maxlen=LATENCY_SAMPLES)).append(seconds)
+
+    def summary(self):
+        out = {}
+        for endpoint, by_status in self.counts.items():
+            samples = sorted(self.latencies[endpoint])
+            out[endpoint] = {
+                "count": sum(by_status.values()),
+                "by_status": {str(s): n for s, n in sorted(by_status.items())},
+                "p50_ms": round(1000 * samples[len(samples) // 2], 1),
+                "p99_ms": round(1000 * samples[round(0.99 * (len(samples) - 1))], 1),
+            }
+        return out
+
+
+metrics = RequestMetrics()
+
+def timed(endpoint):
+    def wrap(handler):
+        async def run(request):
+            start = time.perf_counter()
+            response = await handler(request)
+            metrics.record(endpoint, response.status_code, time.perf_counter() - start)
+            return response
+        return run
+    return wrap
+
+# ------------------- Handlers ------------------- #
+def error(status, message):
+    return JSONResponse({"error": message}, status_code=status)
+
+async def read_form(request, max_files):
+    if not GEMINI_ENABLED:
+        return None, error(503, "No Gemini API key configured (set GEMINI_API_KEY or GEMINI_BACKEND=stub).")
+    limit = max_files * MAX_UPLOAD_MB * 2**20 + 2**20
+    if int(request.headers.get("content-length") or 0) > limit:
+        return None, error(413, f"Request body is over {limit / 2**20:.0f} MB.")
+    try:
+        form = await request.form(max_files=max_files)
+    except Exception as e:
+        return None, error(400, f"Expected multipart/form-data with 'resume' and 'jd': {e}")
+    jd = form.get("jd")
+    jd_text = jd.strip() if isinstance(jd, str) else ""
+    resumes = [f for f in form.getlist("resume") if hasattr(f, "filename")]
+    if not jd_text or not resumes:
+        return None, error(400, "Both a 'resume' PDF and a 'jd' text field are required.")
+    return (resumes, jd_text), None
+
+async def score_one(upload, jd_text):
+    """Returns (status, body) for one resume; body is the final_score_with_gemini JSON on success."""
+    try:
+        resume_text = await scorer.extract(upload)
+        result = await scorer.score(resume_text, jd_text)
+    except UploadRejected as e:
+        return 422, {"error": str(e)}
+    except Overloaded as e:
+        return 503, {"error": f"Scoring queue is full ({e}); retry later."}
+    finally:
+        await upload.close()
+    return (502 if "error" in result else 200), result
+
+@timed("score")
+async def score(request):
+    parsed, failure = await read_form(request, max_files=1)
+    if failure:
+        return failure
+    resumes, jd_text = parsed
+    status, body = await score_one(resumes[0], jd_text)
+    headers = {"Retry-After": "5"} if status == 503 else None
+    return JSONResponse(body, status_code=status, headers=headers)
+
+@timed("score_batch")
+async def score_batch(request):
+    """Several resumes against one JD; results come back in upload order with a status each."""
+    parsed, failure = await read_form(request, max_files=SCORING_BATCH_MAX)
+    if failure:
+        return failure
+    resumes, jd_text = parsed
+    outcomes = await asyncio.gather(*(score_one(upload, jd_text) for upload in resumes))
+    return JSONResponse({
+        "results": [
+            {"filename": upload.filename, "status": status, **body}
+            for upload, (status, body) in zip(resumes, outcomes)
+        ]
+    })
+
+async def health(request):
+    ok = GEMINI_ENABLED
+    return JSONResponse(
+        {"status": "ok" if ok else "unavailable", "backend": GEMINI_BACKEND, "model_enabled": ok},
+        status_code=200 if ok else 503,
+    )
+
+async def metrics_endpoint(request):
+    return JSONResponse({
+        "uptime_s": round(time.time() - metrics.started, 1),
+        "rss_mb": round(current_rss_mb(), 1),
+        "requests": metrics.summary(),
+        "scoring": scorer.stats(),
+        "quota": quota.stats(),
+    })
+
+
+app = Starlette(routes=[
+    Route("/score", score, methods=["POST"]),
+    Route("/score/batch", score_batch, methods=["POST"]),
+    Route("/health", health),
+    Route("/metrics", metrics_endpoint),
+])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    args = parser.parse_args()
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import os
+import json
+import time
+import zlib
+import sqlite3
+import secrets
+import threading
+
+import streamlit as st
+
+# ------------------- Configuration ------------------- #
+SESSION_DB = os.getenv("SESSION_DB", "sessions.db")
+SESSION_TTL_HOURS = float(os.getenv("SESSION_TTL_HOURS", "168"))   # entries untouched this long are deleted
+GC_INTERVAL_SECONDS = 3600
+TOKEN_PARAM = "s"
+
+# Everything the pages need to render without re-running the analysis
+PERSISTED_KEYS = [
+    "analysis_done", "resume_text", "jd_text",
+    "overall_score", "semantic_score", "skill_score", "feedback_text",
+    "soft_skills_required", "soft_skills_present",
+    "technical_skills_required", "technical_skills_present", "recommendations",
+    "upload_report", "prep_plan_text", "prep_days",
+]
+
+# ------------------- Store ------------------- #
+class SessionStore:
+    """Session snapshots as zlib-compressed JSON rows in SQLite, keyed by an opaque token."""
+
+    def __init__(self, path=SESSION_DB, ttl_hours=SESSION_TTL_HOURS):
+        self.path = path
+        self.ttl = ttl_hours * 3600
+        self.last_gc = 0
+        self.lock = threading.Lock()
+        with self._connect() as db:
+            db.execute("CREATE TABLE IF NOT EXISTS sessions (token TEXT PRIMARY KEY, data BLOB, updated REAL)")
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=10)
+
+    def save(self, token, state):
+        blob = zlib.compress(json.dumps(state, separators=(",", ":")).encode())
+        with self._connect() as db:
+            db.execute("INSERT OR REPLACE INTO sessions VALUES (?, ?, ?)", (token, blob, time.time()))
+        self.collect_garbage()
+
+    def load(self, token):
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT data FROM sessions WHERE token = ? AND updated >= ?", (token, time.time() - self.ttl)
+            ).fetchone()
+        return json.loads(zlib.decompress(row[0])) if row else None
+
+    def delete(self, token):
+        with self._connect() as db:
+            db.execute("DELETE FROM sessions WHERE token = ?", (token,))
+
+    def collect_garbage(self, force=False):
+        """Drop expired snapshots, at most once per GC_INTERVAL_SECONDS unless forced."""
+        with self.lock:
+            if not force and time.time() - self.last_gc < GC_INTERVAL_SECONDS:
+                return 0
+            self.last_gc = time.time()
+        with self._connect() as db:
+            return db.execute("DELETE FROM sessions WHERE updated < ?", (time.time() - self.ttl,)).rowcount
+
+
+store = SessionStore()
+
+# ------------------- Streamlit Helpers ------------------- #
+def restore_session():
+    """
+    Call near the top of every page. Keeps the session token in the URL (page links
+    drop query params) and, on the first run of a fresh browser session, reloads the
+    saved snapshot into st.session_state.
+    """
+    token = st.session_state.get("_session_token") or st.query_params.get(TOKEN_PARAM)
+    if not token:
+        return
+    st.session_state["_session_token"] = token
+    if st.query_params.get(TOKEN_PARAM) != token:
+        st.query_params[TOKEN_PARAM] = token
+
+    if not st.session_state.get("_session_restored"):
+        st.session_state["_session_restored"] = True
+        snapshot = store.load(token)
+        for key, value in (snapshot or {}).items():
+            if st.session_state.get(key) is None:
+                st.session_state[key] = value
+
+def persist_session():
+    """Save the analysis state under this session's token, creating the token on first save."""
+    token = st.session_state.get("_session_token")
+    if not token:
+        token = secrets.token_urlsafe(16)
+        st.session_state["_session_token"] = token
+        st.session_state["_session_restored"] = True
+    st.query_params[TOKEN_PARAM] = token
+    store.save(token, {key: st.session_state.get(key) for key in PERSISTED_KEYS})
+
+def forget_session():
+    """Used by "New Analysis": drop the snapshot and the token so nothing is restored."""
+    token = st.session_state.get("_session_token") or st.query_params.get(TOKEN_PARAM)
+    if token:
+        store.delete(token)
+    st.query_params.pop(TOKEN_PARAM, None)
+    st.session_state["_session_token"] = None
+    st.session_state["_session_restored"] = True
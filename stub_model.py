@@ -0,0 +1,56 @@
+import os
+import re
+import json
+import time
+import random
+
+# ------------------- Configuration ------------------- #
+# Used when GEMINI_BACKEND=stub: canned replies in the shape each prompt asks for,
+# after a simulated model latency, so the app runs offline and under load tests.
+STUB_LATENCY_MS = float(os.getenv("GEMINI_STUB_LATENCY_MS", "500"))
+STUB_JITTER_MS = float(os.getenv("GEMINI_STUB_JITTER_MS", "100"))
+# Generation time grows with the reply; set this to compare prompts that ask for more or less output
+STUB_MS_PER_OUTPUT_CHAR = float(os.getenv("GEMINI_STUB_MS_PER_OUTPUT_CHAR", "0"))
+
+SOFT_SKILLS = ["Communication", "Teamwork", "Problem Solving"]
+TECH_SKILLS = ["Python", "SQL", "Docker", "AWS"]
+
+# ------------------- Canned Replies ------------------- #
+def section_ids(prompt):
+    return re.findall(r"\[([0-9a-f]{16})\]", prompt)
+
+def reply_for(prompt):
+    if "skills it requires" in prompt:
+        return json.dumps({i: {"soft_skills_required": SOFT_SKILLS[:2], "technical_skills_required": TECH_SKILLS} for i in section_ids(prompt)})
+    if "skills it demonstrates" in prompt:
+        return json.dumps({
+            i: {"soft_skills_present": SOFT_SKILLS[:1], "technical_skills_present": TECH_SKILLS[:2],
+                "strengths": ["Relevant hands-on experience with concrete tools."],
+                "weaknesses": ["Impact is not quantified with numbers."],
+                "opportunities": ["Lead each bullet with an action verb and a result."], "risks": []}
+            for i in section_ids(prompt)
+        })
+    if "score the overall fit" in prompt:
+        return json.dumps({"overall_score": 72, "semantic_score": 68, "recommendations": ["Quantify achievements with metrics."] * 5})
+    if "Rate how well" in prompt:
+        return json.dumps({"overall_score": random.randint(20, 90), "reason": "Stub lite-model verdict."})
+    if "ATS-style analysis" in prompt:
+        # The real prompt asks for 2-3 detailed points under four headings
+        feedback = "\n".join(
+            f"{heading}:\n" + "\n".join(f"- {heading} point {n}: a detailed, contextual sentence about the resume." for n in range(3))
+            for heading in ["Strengths", "Weaknesses/Missing Skills", "Opportunities", "Risks"]
+        )
+        return json.dumps({
+            "overall_score": 72, "semantic_score": 68, "skill_score": 65,
+            "feedback": feedback,
+            "soft_skills_required": SOFT_SKILLS, "soft_skills_present": SOFT_SKILLS[:1],
+            "technical_skills_required": TECH_SKILLS, "technical_skills_present": TECH_SKILLS[:2],
+            "recommendations": ["Quantify achievements with metrics."] * 5,
+        })
+    return "This is a stub answer generated without calling Gemini. " * 5
+
+def generate(prompt):
+    reply = reply_for(prompt)
+    latency_ms = max(0.0, random.gauss(STUB_LATENCY_MS, STUB_JITTER_MS)) + STUB_MS_PER_OUTPUT_CHAR * len(reply)
+    time.sleep(latency_ms / 1000)
+    return reply
@@ -0,0 +1,123 @@
+import os
+import sys
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+
+import fitz  # PyMuPDF
+
+# ------------------- Configuration ------------------- #
+MAX_UPLOAD_MB = float(os.getenv("MAX_UPLOAD_MB", "10"))        # keep in step with server.maxUploadSize in .streamlit/config.toml
+MAX_RESUME_PAGES = int(os.getenv("MAX_RESUME_PAGES", "10"))    # pages beyond this are not parsed
+TEXT_PROBE_PAGES = 3                                           # pages inspected for a text layer
+SPOOL_CHUNK_BYTES = 1 << 20
+RSS_SAMPLE_SECONDS = 0.005                                     # RSS polling interval while parsing
+
+
+class UploadRejected(ValueError):
+    """Raised when an uploaded PDF fails pre-flight; the message is shown to the user."""
+
+# ------------------- Memory Reporting ------------------- #
+def current_rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError):
+        return peak_rss_mb()
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+@contextmanager
+def sampled_rss():
+    """
+    Poll process RSS on a background thread for the duration of the block and yield
+    {"before_mb", "peak_mb"}. This is the whole process, so concurrent sessions add to it.
+    """
+    usage = {"before_mb": current_rss_mb()}
+    usage["peak_mb"] = usage["before_mb"]
+    done = threading.Event()
+
+    def poll():
+        while not done.wait(RSS_SAMPLE_SECONDS):
+            usage["peak_mb"] = max(usage["peak_mb"], current_rss_mb())
+
+    poller = threading.Thread(target=poll, daemon=True)
+    poller.start()
+    try:
+        yield usage
+    finally:
+        done.set()
+        poller.join()
+        usage["peak_mb"] = max(usage["peak_mb"], current_rss_mb())
+
+# ------------------- Spooling & Pre-flight ------------------- #
+@contextmanager
+def spooled_pdf(uploaded_file, size=None):
+    """
+    Copy an upload to a temp file in fixed-size chunks, yield its path, delete it afterwards.
+    `size` defaults to the .size attribute of Streamlit's UploadedFile.
+    """
+    size = getattr(uploaded_file, "size", 0) if size is None else size
+    size_mb = size / 2**20
+    if size_mb > MAX_UPLOAD_MB:
+        raise UploadRejected(f"The PDF is {size_mb:.1f} MB; the limit is {MAX_UPLOAD_MB:.0f} MB.")
+
+    uploaded_file.seek(0)
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+        shutil.copyfileobj(uploaded_file, tmp, SPOOL_CHUNK_BYTES)
+        path = tmp.name
+    try:
+        yield path
+    finally:
+        os.remove(path)
+
+def preflight(doc):
+    """Cheap checks on an opened document: page count and whether it has a text layer at all."""
+    if doc.page_count == 0:
+        raise UploadRejected("The PDF has no pages.")
+    probe = range(min(doc.page_count, TEXT_PROBE_PAGES))
+    if not any(doc[i].get_text("text").strip() for i in probe):
+        raise UploadRejected("The resume looks like a scanned image with no readable text. Please upload a text-based PDF.")
+    return {"page_count": doc.page_count, "pages_parsed": min(doc.page_count, MAX_RESUME_PAGES)}
+
+def read_resume(uploaded_file, size=None):
+    """
+    Extract resume text from an uploaded PDF without holding extra copies of it in memory:
+    the upload is spooled to disk and PyMuPDF opens it by path. Returns (text, report);
+    the memory figures are process RSS sampled while parsing, not a per-session measure.
+    """
+    size = getattr(uploaded_file, "size", 0) if size is None else size
+    with sampled_rss() as rss, spooled_pdf(uploaded_file, size) as path:
+        try:
+            doc = fitz.open(path)
+        except Exception as e:
+            raise UploadRejected("The file could not be read as a PDF.") from e
+        with doc:
+            report = preflight(doc)
+            text = "".join(doc[i].get_text() for i in range(report["pages_parsed"]))
+
+    report.update({
+        "file_mb": round(size / 2**20, 2),
+        "rss_before_mb": round(rss["before_mb"], 1),
+        "rss_peak_mb": round(rss["peak_mb"], 1),
+        "rss_delta_mb": round(rss["peak_mb"] - rss["before_mb"], 1),
+    })
+    return text.strip(), report
+
+def upload_report_caption(report):
+    capped = f" (first {report['pages_parsed']} of {report['page_count']} pages)" if report["pages_parsed"] < report["page_count"] else ""
+    caption = f"📄 {report['file_mb']} MB, {report['page_count']} pages{capped}"
+    if "rss_peak_mb" in report:  # snapshots saved before RSS sampling don't have it
+        caption += (
+            f" · server memory +{report['rss_delta_mb']} MB while parsing "
+            f"(peak {report['rss_peak_mb']} MB, shared by all sessions)"
+        )
+    return caption